@@ -0,0 +1,113 @@
+# batch_generate.py
+# CROSSWORD PUZZLE — headless batch generation (imports only the generator, no PyQt6/pandas).
+#   python batch_generate.py questions.csv -n 5000 -o puzzles.jsonl --workers 8
+#   python batch_generate.py questions.csv -n 5000 -o puzzles.jsonl --workers 8 --resume
+# Each puzzle is written to the JSONL file as soon as it is ready. Puzzle i always uses
+# seed --seed + i, so an interrupted run resumes exactly where it stopped.
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import crossword_gen as gen
+from compiled_puzzle import compile_puzzle
+from question_bank import load_question_bank
+
+_QUESTIONS = None
+
+def _init_worker(questions):
+    # each worker gets the bank once instead of with every task
+    global _QUESTIONS
+    _QUESTIONS = questions
+
+def build_puzzle(index, seed, words, grid_size, engine):
+    random.seed(seed)
+    pick, grid, placements = gen.create_crossword_for_student(_QUESTIONS, words, engine=engine, grid_size=grid_size)
+    record = {"index": index, "seed": seed, "grid_size": grid_size}
+    if grid is None:
+        record["status"] = "failed"
+        return record
+    record["status"] = "ok"
+    # grid rows and numbered entries, readable back with CompiledPuzzle.from_json(record)
+    record.update(compile_puzzle(grid, placements).to_json())
+    record["question_ids"] = [q["id"] for q in pick]
+    return record
+
+def completed_indices(path):
+    """Indices already in the output file; a torn last line from an interrupted run is cut off."""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    good_end = 0
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                done.add(json.loads(line)["index"])
+            except (ValueError, KeyError):
+                break
+            good_end += len(line)
+    if good_end != os.path.getsize(path):
+        with open(path, "r+b") as f:
+            f.truncate(good_end)
+    return done
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Generate crossword puzzles to a JSONL file")
+    ap.add_argument("bank", help="question bank (.xlsx, .csv, .json or .jsonl)")
+    ap.add_argument("-n", "--count", type=int, required=True, help="number of puzzles")
+    ap.add_argument("-o", "--out", required=True, help="output .jsonl file")
+    ap.add_argument("--workers", type=int, default=1)
+    ap.add_argument("--seed", type=int, default=0, help="puzzle i uses seed SEED + i")
+    ap.add_argument("--words", type=int, default=gen.WORDS_TO_PICK)
+    ap.add_argument("--grid-size", type=int, default=gen.GRID_SIZE)
+    ap.add_argument("--engine", choices=sorted(gen.ENGINES), default=gen.GENERATOR_ENGINE)
+    ap.add_argument("--resume", action="store_true", help="skip puzzles already in the output file")
+    args = ap.parse_args(argv)
+
+    questions = load_question_bank(args.bank)
+    if len(questions) < args.words:
+        ap.error(f"{args.bank} has {len(questions)} usable questions, need at least {args.words}")
+    if args.resume:
+        done = completed_indices(args.out)
+    else:
+        done = set()
+        open(args.out, "w").close()
+    todo = (i for i in range(args.count) if i not in done)
+    ok = failed = 0
+    t0 = time.perf_counter()
+
+    with open(args.out, "a", encoding="utf-8") as out:
+        def write(record):
+            nonlocal ok, failed
+            out.write(json.dumps(record) + "\n"); out.flush()
+            if record["status"] == "ok": ok += 1
+            else: failed += 1
+
+        if args.workers <= 1:
+            _init_worker(questions)
+            for i in todo:
+                write(build_puzzle(i, args.seed + i, args.words, args.grid_size, args.engine))
+        else:
+            # a bounded window of in-flight puzzles keeps memory flat however large --count is
+            window = args.workers * 2
+            with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker, initargs=(questions,)) as pool:
+                pending = set()
+                for i in todo:
+                    pending.add(pool.submit(build_puzzle, i, args.seed + i, args.words, args.grid_size, args.engine))
+                    if len(pending) >= window:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for fut in finished:
+                            write(fut.result())
+                for fut in pending:
+                    write(fut.result())
+
+    elapsed = time.perf_counter() - t0
+    print(f"{ok} puzzles written, {failed} failed, {len(done)} already present ({elapsed:.1f}s)", file=sys.stderr)
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
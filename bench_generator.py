@@ -0,0 +1,270 @@
+# bench_generator.py
+# Headless benchmarks for the crossword generator (no Qt needed).
+#   python bench_generator.py fits
+#   python bench_generator.py scan --size 40
+#   python bench_generator.py suite --out before.json
+#   python bench_generator.py suite --targets student     (create_crossword_for_student end to end)
+#   python bench_generator.py scaling
+#   python bench_generator.py compare before.json after.json
+
+import argparse
+import json
+import math
+import platform
+import random
+import string
+import time
+from datetime import datetime
+
+import crossword_gen as gen
+
+def sample_grids(count, seed):
+    # real generator output, so the candidate mix matches what the app sees
+    random.seed(seed)
+    grids = []
+    while len(grids) < count:
+        pick = random.sample(gen.DUMMY_QUESTIONS, k=gen.WORDS_TO_PICK)
+        words = [{"answer": q["answer"], "clue": q["clue"]} for q in pick]
+        grid, _ = gen.try_generate_grid_for_words(words, backend="list")
+        if grid is not None:
+            grids.append(grid)
+    return grids
+
+def bench_fits(args):
+    grids = sample_grids(args.grids, args.seed)
+    words = [q["answer"] for q in gen.DUMMY_QUESTIONS]
+    n = gen.GRID_SIZE
+    cands = [(w, r, c, dr, dc) for w in words for r in range(n) for c in range(n) for dr, dc in ((0, 1), (1, 0))]
+    backends = {"list": grids, "bitboard": [gen.BitGrid.from_rows(g) for g in grids]}
+    results = {}
+    for name, gs in backends.items():
+        answers = []
+        t0 = time.perf_counter()
+        for g in gs:
+            for w, r, c, dr, dc in cands:
+                answers.append(gen.fits(g, w, r, c, dr, dc))
+        elapsed = time.perf_counter() - t0
+        results[name] = answers
+        print(f"{name:>9}: {len(answers):>8} candidate tests in {elapsed:.3f}s -> {len(answers)/elapsed:,.0f} tests/s")
+    if results["list"] != results["bitboard"]:
+        print("WARNING: backends disagree on some candidates")
+
+def bench_scan(args):
+    # all-positions fallback scan: one fits() per (r, c, orientation) vs. the batched numpy pass
+    if gen.load_numpy() is None:
+        print("numpy is not installed; only the per-position scan is available")
+    random.seed(args.seed)
+    n = args.size
+    words = [q["answer"] for q in gen.DUMMY_QUESTIONS]
+    grids = []
+    for _ in range(args.grids):
+        g = gen.empty_grid(n, "list")
+        # scatter words wherever they fit to get a realistically crowded board
+        for _ in range(n * 2):
+            w = random.choice(words); dr, dc = random.choice(((0, 1), (1, 0)))
+            r = random.randrange(n); c = random.randrange(n)
+            if gen.fits(g, w, r, c, dr, dc):
+                gen.place_word_on_grid(g, w, r, c, dr, dc)
+        grids.append(g)
+    t0 = time.perf_counter()
+    slow = [sorted((rr, cc, dr, dc) for rr in range(n) for cc in range(n) for dr, dc in ((0, 1), (1, 0))
+                   if gen.fits(g, w, rr, cc, dr, dc)) for g in grids for w in words]
+    t_loop = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fast = [sorted(gen.all_fitting_positions(g, w)) for g in grids for w in words]
+    t_batch = time.perf_counter() - t0
+    scans = len(grids) * len(words)
+    print(f"{n}x{n} grid, {scans} scans")
+    print(f"  per-position fits(): {t_loop*1000/scans:8.3f} ms/scan")
+    print(f"  all_fitting_positions(): {t_batch*1000/scans:8.3f} ms/scan")
+    if slow != fast:
+        print("WARNING: scans disagree")
+
+# rough English letter frequencies, so synthetic answers cross about as often as real ones
+LETTER_WEIGHTS = [8.2, 1.5, 2.8, 4.3, 12.7, 2.2, 2.0, 6.1, 7.0, 0.2, 0.8, 4.0, 2.4,
+                  6.7, 7.5, 1.9, 0.1, 6.0, 6.3, 9.1, 2.8, 1.0, 2.4, 0.2, 2.0, 0.1]
+LENGTH_PROFILES = {"short": (3, 5), "mixed": (3, 10), "long": (7, 12)}
+
+def synthetic_pool(size, lengths, rng):
+    lo, hi = LENGTH_PROFILES[lengths]
+    pool = []
+    for i in range(size):
+        answer = "".join(rng.choices(string.ascii_uppercase, weights=LETTER_WEIGHTS, k=rng.randint(lo, hi)))
+        pool.append({"id": i + 1, "clue": f"clue {i + 1}", "answer": answer})
+    return pool
+
+def percentile(values, p):
+    # nearest-rank percentile; values need not be sorted
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+class FitsCounter:
+    # counts candidate positions tested while installed: fits() calls on both grid backends, plus
+    # every position an all_fitting_positions() numpy pass covers, so backends compare fairly
+    def __init__(self):
+        self.calls = 0
+        self._orig = (gen.fits, gen.BitGrid.fits, gen.all_fitting_positions)
+
+    def __enter__(self):
+        orig_fits, orig_bit, orig_scan = self._orig
+        def counted_fits(*a, **kw):
+            self.calls += 1; return orig_fits(*a, **kw)
+        def counted_bit(grid, *a, **kw):
+            self.calls += 1; return orig_bit(grid, *a, **kw)
+        def counted_scan(grid, word):
+            before = self.calls
+            out = orig_scan(grid, word)
+            n = len(grid)
+            if self.calls == before and len(word) <= n:
+                # the numpy pass: as many positions as the per-position scan tests, one per cell and direction
+                self.calls += 2 * n * n
+            return out
+        gen.fits = counted_fits; gen.BitGrid.fits = counted_bit; gen.all_fitting_positions = counted_scan
+        return self
+
+    def __exit__(self, *exc):
+        gen.fits, gen.BitGrid.fits, gen.all_fitting_positions = self._orig
+
+# "grid": one generate_grid() call on a fixed pick; "student": create_crossword_for_student()
+# end to end, as the app calls it (drawing the pick from the pool, retries included)
+TARGETS = ("grid", "student")
+
+def run_config(engine, size, words, lengths, pool_size, trials, seed, count_fits=True, target="grid"):
+    rng = random.Random(seed)
+    pool = synthetic_pool(pool_size, lengths, rng)
+    picks = [[dict(q) for q in rng.sample(pool, k=min(words, pool_size))] for _ in range(trials)]
+    questions = [gen.as_question(q) for q in pool]
+
+    def run(t, stats):
+        random.seed(seed + t)
+        if target == "student":
+            return gen.create_crossword_for_student(questions, words, engine=engine, grid_size=size)[1]
+        return gen.generate_grid(picks[t], engine, stats=stats, n=size)[0]
+
+    # warm up untimed: numpy is imported on the first fallback scan, and that import (plus cold
+    # caches) would otherwise land in the first trial and show up as a p95/p99 outlier
+    gen.load_numpy()
+    run(0, {})
+    latencies = []; ok = 0; attempts = 0; fits_calls = 0
+    for t in range(trials):
+        st = {}
+        t0 = time.perf_counter()
+        grid = run(t, st)
+        latencies.append(time.perf_counter() - t0)
+        attempts += st.get("attempts", 0)
+        if grid is not None:
+            ok += 1
+    if count_fits:
+        # second pass with the same seeds, instrumented, so counting doesn't skew the latencies
+        with FitsCounter() as counter:
+            for t in range(trials):
+                run(t, {})
+            fits_calls = counter.calls
+    ms = [x * 1000 for x in latencies]
+    return {
+        "target": target, "engine": engine, "grid_size": size, "words": words, "lengths": lengths, "pool_size": pool_size,
+        "trials": trials, "seed": seed,
+        "success_rate": ok / trials,
+        "p50_ms": percentile(ms, 50), "p95_ms": percentile(ms, 95), "p99_ms": percentile(ms, 99),
+        "attempts_per_success": attempts / ok if ok and target == "grid" else None,
+        "fits_calls_per_success": fits_calls / ok if ok and count_fits else None,
+    }
+
+def fmt(v, spec):
+    if v is None:
+        # keep the column width of spec, right-aligned unless spec says otherwise
+        width = spec.split(".")[0]
+        return format("-", width if width[:1] in "<>^" else ">" + width)
+    return format(v, spec)
+
+def bench_suite(args):
+    results = []
+    print(f"{'target':>7} {'engine':>9} {'n':>3} {'words':>5} {'lengths':>7} {'pool':>6} {'ok%':>6} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8} {'att/ok':>8} {'fits/ok':>10}")
+    configs = [(target, engine, size, words, lengths, pool_size) for target in args.targets for engine in args.engine
+               for size in args.sizes for words in args.words for lengths in args.lengths for pool_size in args.pools]
+    for target, engine, size, words, lengths, pool_size in configs:
+        r = run_config(engine, size, words, lengths, pool_size, args.trials, args.seed, target=target)
+        results.append(r)
+        print(f"{target:>7} {engine:>9} {size:>3} {words:>5} {lengths:>7} {pool_size:>6} {r['success_rate']*100:>6.1f} "
+              f"{fmt(r['p50_ms'], '8.2f')} {fmt(r['p95_ms'], '8.2f')} {fmt(r['p99_ms'], '8.2f')} "
+              f"{fmt(r['attempts_per_success'], '8.1f')} {fmt(r['fits_calls_per_success'], '10.0f')}")
+    if args.out:
+        meta = {"created": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+                "numpy": gen.load_numpy() is not None, "argv": vars(args) | {"func": None}}
+        with open(args.out, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+        print(f"wrote {args.out}")
+
+# (grid size, words) pairs from the classroom default up to the advanced-class target
+SCALING_STEPS = [(16, 7), (24, 15), (32, 30), (40, 50), (48, 70), (64, 120)]
+
+def bench_scaling(args):
+    results = []
+    print(f"{'engine':>9} {'n':>3} {'words':>5} {'ok%':>6} {'p50ms':>9} {'p95ms':>9} {'att/ok':>8}")
+    for engine in args.engine:
+        for size, words in SCALING_STEPS[:args.steps]:
+            r = run_config(engine, size, words, args.lengths, max(words * 40, 500), args.trials, args.seed, count_fits=False)
+            results.append(r)
+            print(f"{engine:>9} {size:>3} {words:>5} {r['success_rate']*100:>6.1f} {fmt(r['p50_ms'], '9.2f')} "
+                  f"{fmt(r['p95_ms'], '9.2f')} {fmt(r['attempts_per_success'], '8.1f')}")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"meta": {"created": datetime.now().isoformat(timespec="seconds")}, "results": results}, f, indent=2)
+        print(f"wrote {args.out}")
+
+def bench_compare(args):
+    # side-by-side of two suite runs, matched on their configuration
+    def load(path):
+        with open(path) as f:
+            # files written before "target" existed only timed generate_grid()
+            return {(r.get("target", "grid"),) + tuple(r[k] for k in ("engine", "grid_size", "words", "lengths", "pool_size")): r
+                    for r in json.load(f)["results"]}
+    a, b = load(args.before), load(args.after)
+    print(f"{'config':>44} {'ok% a->b':>14} {'p95ms a->b':>20} {'fits/ok a->b':>22}")
+    for key in sorted(set(a) & set(b), key=str):
+        ra, rb = a[key], b[key]
+        print(f"{' '.join(map(str, key)):>44} {ra['success_rate']*100:>6.1f}->{rb['success_rate']*100:<6.1f} "
+              f"{fmt(ra['p95_ms'], '9.2f')}->{fmt(rb['p95_ms'], '<9.2f')} "
+              f"{fmt(ra['fits_calls_per_success'], '10.0f')}->{fmt(rb['fits_calls_per_success'], '<10.0f')}")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Crossword generator benchmarks")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("fits", help="candidate tests per second for the list and bitboard grids")
+    p.add_argument("--grids", type=int, default=20)
+    p.add_argument("--seed", type=int, default=1234)
+    p.set_defaults(func=bench_fits)
+    p = sub.add_parser("scan", help="all-positions fallback scan, per-position vs. numpy")
+    p.add_argument("--size", type=int, default=gen.GRID_SIZE)
+    p.add_argument("--grids", type=int, default=10)
+    p.add_argument("--seed", type=int, default=1234)
+    p.set_defaults(func=bench_scan)
+    p = sub.add_parser("suite", help="success rate, latency percentiles and positions tested per success over a parameter sweep")
+    p.add_argument("--engine", nargs="+", default=sorted(gen.ENGINES))
+    p.add_argument("--sizes", nargs="+", type=int, default=[12, 16, 24])
+    p.add_argument("--words", nargs="+", type=int, default=[5, 7, 10])
+    p.add_argument("--lengths", nargs="+", choices=sorted(LENGTH_PROFILES), default=["short", "mixed", "long"])
+    p.add_argument("--pools", nargs="+", type=int, default=[50, 500])
+    p.add_argument("--targets", nargs="+", choices=TARGETS, default=list(TARGETS))
+    p.add_argument("--trials", type=int, default=30)
+    p.add_argument("--seed", type=int, default=1234)
+    p.add_argument("--out", help="write the results as JSON")
+    p.set_defaults(func=bench_suite)
+    p = sub.add_parser("scaling", help="latency as grid size and word count grow together")
+    p.add_argument("--engine", nargs="+", default=sorted(gen.ENGINES))
+    p.add_argument("--steps", type=int, default=len(SCALING_STEPS))
+    p.add_argument("--lengths", choices=sorted(LENGTH_PROFILES), default="mixed")
+    p.add_argument("--trials", type=int, default=10)
+    p.add_argument("--seed", type=int, default=1234)
+    p.add_argument("--out", help="write the results as JSON")
+    p.set_defaults(func=bench_scaling)
+    p = sub.add_parser("compare", help="compare two JSON files written by suite --out")
+    p.add_argument("before"); p.add_argument("after")
+    p.set_defaults(func=bench_compare)
+    args = ap.parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
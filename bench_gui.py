@@ -0,0 +1,91 @@
+# bench_gui.py
+# Keystroke cost over a long session of puzzles (a lab kiosk runs a few hundred a day).
+# Builds the real window offscreen, plays `--puzzles` puzzles back to back and types every
+# answer, timing each key press including the repaint it triggers. Per-keystroke cost, the
+# grid's signal connections and the window's object count must stay flat from first to last.
+#   python bench_gui.py
+#   python bench_gui.py --puzzles 500 --every 50 --out session.json
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+import v21
+from bench_generator import percentile, fmt
+
+def press(widget, key, text=""):
+    app = QtWidgets.QApplication.instance()
+    t0 = time.perf_counter()
+    QtWidgets.QApplication.sendEvent(widget, QtGui.QKeyEvent(QtCore.QEvent.Type.KeyPress, key, QtCore.Qt.KeyboardModifier.NoModifier, text))
+    app.processEvents()  # include the repaint the key press scheduled
+    return (time.perf_counter() - t0) * 1e6
+
+def play_puzzle(window):
+    # type every answer (the last letter wrong, then fixed with backspace), then score the puzzle
+    grid = window.grid_view; times = []
+    for pl in window.placements:
+        grid.setFocus(); grid.select(pl.r, pl.c, (pl.dr, pl.dc))
+        for ch in pl.word[:-1]:
+            times.append(press(grid, ord(ch), ch))
+        times.append(press(grid, QtCore.Qt.Key.Key_Q, "Q"))
+        times.append(press(grid, QtCore.Qt.Key.Key_Backspace))
+        times.append(press(grid, ord(pl.word[-1]), pl.word[-1]))
+    window.evaluate_all_words()
+    return times
+
+def connections(grid):
+    return grid.receivers(grid.cellSelected) + grid.receivers(grid.letterEntered)
+
+def run(args):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    window = v21.CrosswordApp(); window.show()
+    window.wait_for_startup()
+    # generate inline so a background thread doesn't add noise to the key timings
+    window.prefetcher.stop()
+    rows = []; batch = []
+    print(f"{'puzzles':>11} {'keys':>6} {'p50us':>8} {'p95us':>8} {'conns':>6} {'objects':>8}")
+    for i in range(1, args.puzzles + 1):
+        window.generate_and_build(); app.processEvents()
+        batch += play_puzzle(window)
+        if i % args.every == 0 or i == args.puzzles:
+            app.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete.value)
+            row = {"puzzles": [i - (i - 1) % args.every, i], "keys": len(batch),
+                   "p50_us": percentile(batch, 50), "p95_us": percentile(batch, 95),
+                   "connections": connections(window.grid_view), "objects": len(window.findChildren(QtCore.QObject))}
+            rows.append(row); batch = []
+            print(f"{row['puzzles'][0]:>5}-{row['puzzles'][1]:<5} {row['keys']:>6} {fmt(row['p50_us'], '8.1f')} "
+                  f"{fmt(row['p95_us'], '8.1f')} {row['connections']:>6} {row['objects']:>8}")
+    first, last = rows[0], rows[-1]
+    ratio = last["p50_us"] / first["p50_us"] if first["p50_us"] else None
+    ok = (ratio is not None and ratio <= args.max_ratio
+          and last["connections"] == first["connections"] and last["objects"] <= first["objects"])
+    print(f"p50 last/first: {fmt(ratio, '.2f')} (limit {args.max_ratio}); "
+          f"connections {first['connections']}->{last['connections']}; objects {first['objects']}->{last['objects']}: "
+          f"{'OK' if ok else 'REGRESSION'}")
+    if args.out:
+        meta = {"created": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+                "qt": QtCore.QT_VERSION_STR, "argv": vars(args)}
+        with open(args.out, "w") as f:
+            json.dump({"meta": meta, "results": rows, "ratio": ratio, "ok": ok}, f, indent=2)
+        print(f"wrote {args.out}")
+    return ok
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Keystroke cost across consecutive puzzles")
+    ap.add_argument("--puzzles", type=int, default=500)
+    ap.add_argument("--every", type=int, default=50, help="puzzles per reported batch")
+    ap.add_argument("--max-ratio", type=float, default=1.5, help="allowed growth of the median key press, last batch vs. first")
+    ap.add_argument("--out", help="write the results as JSON")
+    args = ap.parse_args(argv)
+    sys.exit(0 if run(args) else 1)
+
+if __name__ == "__main__":
+    main()
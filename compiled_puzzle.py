@@ -0,0 +1,103 @@
+# compiled_puzzle.py
+# CROSSWORD PUZZLE — a generated puzzle compiled once for display, checking and export (no Qt, no pandas).
+# compile_puzzle(grid, placements) numbers the grid, pairs every numbered run with the placement
+# that starts there (by position, so a word used twice keeps both clues) and builds the
+# cell -> entry maps. The result is read-only, pickles, and round-trips through JSON, so the
+# prefetch thread and batch_generate.py can hand out finished puzzles.
+
+from collections import namedtuple
+
+from crossword_gen import Placement
+
+DIRECTIONS = {"across": (0, 1), "down": (1, 0)}
+
+class Entry(namedtuple("Entry", "number direction r c word clue")):
+    """One numbered run of letters. clue is None for a run no placement asked for."""
+    __slots__ = ()
+
+    @property
+    def dr(self):
+        return DIRECTIONS[self.direction][0]
+
+    @property
+    def dc(self):
+        return DIRECTIONS[self.direction][1]
+
+    def cells(self):
+        dr, dc = DIRECTIONS[self.direction]
+        return tuple((self.r + dr*i, self.c + dc*i) for i in range(len(self.word)))
+
+class CompiledPuzzle:
+    """Grid rows and numbered entries (across first, then down, each by number) plus lookups derived from them."""
+    __slots__ = ("grid", "entries", "numbers", "by_clue", "cell_entries")
+
+    def __init__(self, grid, entries):
+        entries = tuple(Entry(*e) for e in entries)
+        numbers = {}; by_clue = {}; cell_entries = {d: {} for d in DIRECTIONS.values()}
+        for eid, e in enumerate(entries):
+            numbers[(e.r, e.c)] = e.number
+            by_clue[(e.number, e.direction)] = eid
+            at = cell_entries[DIRECTIONS[e.direction]]
+            for i, cell in enumerate(e.cells()):
+                at[cell] = (eid, i)
+        for name, value in (("grid", tuple("".join(row) for row in grid)), ("entries", entries),
+                            ("numbers", numbers), ("by_clue", by_clue), ("cell_entries", cell_entries)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledPuzzle is read-only")
+
+    def __reduce__(self):
+        return (CompiledPuzzle, (self.grid, self.entries))
+
+    @property
+    def n(self):
+        return len(self.grid)
+
+    def across(self):
+        return [e for e in self.entries if e.direction == "across"]
+
+    def down(self):
+        return [e for e in self.entries if e.direction == "down"]
+
+    def placed(self):
+        # the entries that came from placements: what gets checked and scored
+        return [e for e in self.entries if e.clue is not None]
+
+    def to_json(self):
+        return {"grid": list(self.grid),
+                "entries": [{"number": e.number, "direction": e.direction, "row": e.r, "col": e.c,
+                             "answer": e.word, "clue": e.clue} for e in self.entries]}
+
+    @classmethod
+    def from_json(cls, data):
+        """Inverse of to_json(); also reads batch_generate.py records written before entries were numbered."""
+        entries = data["entries"]
+        if all("number" in e for e in entries):
+            return cls(data["grid"], [(e["number"], e["direction"], e["row"], e["col"], e["answer"], e["clue"]) for e in entries])
+        placements = [Placement(e["answer"], e["clue"], e["row"], e["col"], *DIRECTIONS[e["direction"]]) for e in entries]
+        return compile_puzzle(data["grid"], placements)
+
+def compile_puzzle(grid, placements):
+    rows = ["".join(row) for row in grid]; n = len(rows)
+    clues = {(pl.r, pl.c, pl.dr, pl.dc, len(pl.word)): pl.clue for pl in placements}
+    across = []; down = []; num = 0
+    for r, row in enumerate(rows):
+        for c, ch in enumerate(row):
+            if ch == " ": continue
+            # a clue starts where a run of two or more letters begins
+            start_across = (c == 0 or row[c-1] == " ") and c + 1 < n and row[c+1] != " "
+            start_down = (r == 0 or rows[r-1][c] == " ") and r + 1 < n and rows[r+1][c] != " "
+            if not (start_across or start_down): continue
+            num += 1
+            if start_across:
+                end = row.find(" ", c)
+                word = row[c:end if end != -1 else n]
+                across.append(Entry(num, "across", r, c, word, clues.get((r, c, 0, 1, len(word)))))
+            if start_down:
+                end = r
+                while end < n and rows[end][c] != " ":
+                    end += 1
+                word = "".join(rows[i][c] for i in range(r, end))
+                down.append(Entry(num, "down", r, c, word, clues.get((r, c, 1, 0, len(word)))))
+    return CompiledPuzzle(rows, across + down)
@@ -0,0 +1,755 @@
+# crossword_gen.py
+# CROSSWORD PUZZLE — generation engine used by v21.py.
+# Pure Python (no Qt, no pandas) so it can be imported by the benchmark and batch tools.
+
+import atexit
+import gc
+import hashlib
+import itertools
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from functools import lru_cache, partial
+from operator import itemgetter
+
+# numpy is optional and only speeds up the all-positions fallback scan, so it is imported the
+# first time that scan runs (see load_numpy) instead of slowing down every import of this module
+np = None
+sliding_window_view = None
+_numpy_tried = False
+
+def load_numpy():
+    """The numpy module, or None when it is not installed."""
+    global np, sliding_window_view, _numpy_tried
+    if not _numpy_tried:
+        _numpy_tried = True
+        try:
+            import numpy
+            from numpy.lib.stride_tricks import sliding_window_view as swv
+            np = numpy; sliding_window_view = swv
+        except ImportError:
+            pass
+    return np
+
+GRID_SIZE = 16
+WORDS_TO_PICK = 7
+# "list" keeps the classic list[list[str]] grid, "bitboard" uses BitGrid below
+GRID_BACKEND = "list"
+
+# --- question records ---
+def normalize_answer(answer):
+    return answer.upper().replace(" ", "")
+
+def question_key(q):
+    """Stable 64-bit key of a question from its normalized answer and clue.
+
+    Unlike the id (a row number when the bank has no id column, and 1-20 for the built-in
+    questions) it survives rows being inserted or deleted and a different bank being loaded."""
+    text = normalize_answer(str(q["answer"])) + "\x1f" + " ".join(str(q["clue"]).split())
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+class Question(tuple):
+    """One bank entry (id, clue, answer), normalized once and read-only. q["answer"] works like the old dicts."""
+    __slots__ = ()
+    _fields = ("id", "clue", "answer")
+    _index = {name: i for i, name in enumerate(_fields)}
+
+    def __new__(cls, id, clue, answer):
+        # interned: the same answer in many banks/picks is one string, and compares by identity
+        return tuple.__new__(cls, (id, clue, sys.intern(normalize_answer(answer))))
+
+    @classmethod
+    def from_normalized(cls, ids, clues, answers):
+        # columns whose answers are already normalized, e.g. a compiled bank. Building 100k+
+        # records is mostly cyclic-GC passes over objects that cannot form cycles, so pause it
+        was_enabled = gc.isenabled(); gc.disable()
+        try:
+            return list(map(partial(tuple.__new__, cls), zip(ids, clues, map(sys.intern, answers))))
+        finally:
+            if was_enabled:
+                gc.enable()
+
+    id = property(itemgetter(0))
+    clue = property(itemgetter(1))
+    answer = property(itemgetter(2))
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            # only the record's fields, like the old dicts: q["count"] is a KeyError, not tuple.count
+            i = self._index.get(key)
+            if i is None:
+                raise KeyError(key)
+            key = i
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        i = self._index.get(key)
+        return default if i is None else tuple.__getitem__(self, i)
+
+    def __reduce__(self):
+        return Question, tuple(self)
+
+    def __repr__(self):
+        return f"Question({self.id!r}, {self.clue!r}, {self.answer!r})"
+
+def as_question(q):
+    # Question records pass through; plain {"clue", "answer"[, "id"]} dicts are converted
+    return q if isinstance(q, Question) else Question(q.get("id"), q["clue"], q["answer"])
+
+# small sample pool — replace with your real dataset if needed
+DUMMY_QUESTIONS = (
+    Question(1, "Capital of France", "PARIS"),
+    Question(2, "Largest planet", "JUPITER"),
+    Question(3, "Opposite of hot", "COLD"),
+    Question(4, "Feline pet", "CAT"),
+    Question(5, "Sound unit", "DECIBEL"),
+    Question(6, "A small stream", "BROOK"),
+    Question(7, "Not heavy", "LIGHT"),
+    Question(8, "To freeze water", "ICE"),
+    Question(9, "Used for cutting", "SCISSORS"),
+    Question(10, "Opposite of night", "DAY"),
+    Question(11, "A flying mammal", "BAT"),
+    Question(12, "Computer brain", "CPU"),
+    Question(13, "Unit of memory", "BYTE"),
+    Question(14, "Ocean animal with eight arms", "OCTOPUS"),
+    Question(15, "Yellow fruit", "BANANA"),
+    Question(16, "Precious metal", "GOLD"),
+    Question(17, "Time of day [abbr]", "AM"),
+    Question(18, "A fast animal", "CHEETAH"),
+    Question(19, "Bird that cannot fly", "EMU"),
+    Question(20, "Opposite of left", "RIGHT"),
+)
+
+# --- crossword generation ---
+class Placement:
+    def __init__(self, word, clue, r, c, dr, dc):
+        self.word = word; self.clue = clue; self.r = r; self.c = c; self.dr = dr; self.dc = dc
+
+@lru_cache(maxsize=4096)
+def word_letter_masks(word):
+    # ((letter, bitmask of positions holding that letter), ...) for one word
+    masks = {}
+    for i, ch in enumerate(word):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    return tuple(masks.items())
+
+class BitGrid:
+    """Bitboard grid: one occupancy mask and one mask per letter for every row and column.
+
+    Bit j of row mask r is cell (r, j); bit i of column mask c is cell (i, c).
+    Indexing (grid[r][c]) and len() behave like the list grid, so code that only
+    reads cells works with either backend.
+    """
+    def __init__(self, n=GRID_SIZE):
+        self.n = n
+        self.cells = [[" " for _ in range(n)] for __ in range(n)]
+        self.occ_rows = [0]*n; self.occ_cols = [0]*n
+        self.letter_rows = {}; self.letter_cols = {}
+
+    @classmethod
+    def from_rows(cls, rows):
+        g = cls(len(rows))
+        for r, row in enumerate(rows):
+            for c, ch in enumerate(row):
+                if ch != " ":
+                    g.set_cell(r, c, ch)
+        return g
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, r):
+        return self.cells[r]
+
+    def __iter__(self):
+        return iter(self.cells)
+
+    def set_cell(self, r, c, ch):
+        self.cells[r][c] = ch
+        self.occ_rows[r] |= 1 << c; self.occ_cols[c] |= 1 << r
+        if ch not in self.letter_rows:
+            self.letter_rows[ch] = [0]*self.n; self.letter_cols[ch] = [0]*self.n
+        self.letter_rows[ch][r] |= 1 << c; self.letter_cols[ch][c] |= 1 << r
+
+    def clear_cell(self, r, c):
+        ch = self.cells[r][c]
+        if ch == " ":
+            return
+        self.cells[r][c] = " "
+        self.occ_rows[r] &= ~(1 << c); self.occ_cols[c] &= ~(1 << r)
+        self.letter_rows[ch][r] &= ~(1 << c); self.letter_cols[ch][c] &= ~(1 << r)
+
+    def place(self, word, r, c, dr, dc):
+        # returns the cells that were empty before, i.e. the undo log for this word
+        added = []
+        for i, ch in enumerate(word):
+            rr = r+dr*i; cc = c+dc*i
+            if self.cells[rr][cc] == " ":
+                added.append((rr, cc))
+            self.set_cell(rr, cc, ch)
+        return added
+
+    def fits(self, word, r, c, dr, dc):
+        n = self.n; L = len(word)
+        # line = the row (across) or column (down) the word lies on, pos = offset along it
+        if dc:
+            line, pos = r, c
+            occ, letters = self.occ_rows, self.letter_rows
+        else:
+            line, pos = c, r
+            occ, letters = self.occ_cols, self.letter_cols
+        if not (0 <= line < n and 0 <= pos and pos + L <= n):
+            return False
+        span = ((1 << L) - 1) << pos
+        here = occ[line]
+        taken = here & span
+        # every occupied cell in the span must hold the same letter as the word
+        if taken:
+            matched = 0
+            for ch, m in word_letter_masks(word):
+                lm = letters.get(ch)
+                if lm is not None:
+                    matched |= lm[line] & (m << pos)
+            if matched != taken:
+                return False
+        # new letters may not touch a neighbour on either side of the line
+        free = span & ~here
+        side = (occ[line-1] if line > 0 else 0) | (occ[line+1] if line + 1 < n else 0)
+        if side & free:
+            return False
+        # the cells just before and after the word must be empty
+        ends = (1 << pos >> 1) | (1 << (pos + L))
+        return not (here & ends)
+
+def empty_grid(n=GRID_SIZE, backend=None):
+    if (backend or GRID_BACKEND) == "bitboard":
+        return BitGrid(n)
+    return [[" " for _ in range(n)] for __ in range(n)]
+
+def fits(grid, word, r, c, dr, dc):
+    if isinstance(grid, BitGrid):
+        return grid.fits(word, r, c, dr, dc)
+    n = len(grid)
+    end_r = r + dr*(len(word)-1)
+    end_c = c + dc*(len(word)-1)
+    if not (0 <= r < n and 0 <= c < n and 0 <= end_r < n and 0 <= end_c < n):
+        return False
+    for i, ch in enumerate(word):
+        rr = r + dr*i; cc = c + dc*i
+        existing = grid[rr][cc]
+        if existing != " " and existing != ch:
+            return False
+        if existing == " ":
+            perp_dr, perp_dc = dc, dr
+            for offset in (-1, 1):
+                rr2 = rr + perp_dr*offset; cc2 = cc + perp_dc*offset
+                if 0 <= rr2 < n and 0 <= cc2 < n and grid[rr2][cc2] != " ":
+                    return False
+    before_r = r - dr; before_c = c - dc
+    if 0 <= before_r < n and 0 <= before_c < n and grid[before_r][before_c] != " ":
+        return False
+    after_r = end_r + dr; after_c = end_c + dc
+    if 0 <= after_r < n and 0 <= after_c < n and grid[after_r][after_c] != " ":
+        return False
+    return True
+
+def place_word_on_grid(grid, word, r, c, dr, dc, letter_index=None):
+    if isinstance(grid, BitGrid):
+        grid.place(word, r, c, dr, dc)
+    else:
+        for i, ch in enumerate(word):
+            grid[r+dr*i][c+dc*i] = ch
+    # keep the letter -> cells index in step with the grid when one is supplied
+    if letter_index is not None:
+        for i, ch in enumerate(word):
+            letter_index.setdefault(ch, set()).add((r+dr*i, c+dc*i))
+
+def crossing_candidates(letter_index, word):
+    # every (row, col, index-in-word) where a placed letter matches a letter of the word
+    cands = []
+    for idx, ch in enumerate(word):
+        for r0, c0 in letter_index.get(ch, ()):
+            cands.append((r0, c0, idx))
+    return cands
+
+def grid_to_array(grid):
+    # uint8 board: 0 for an empty cell, the letter's byte value otherwise
+    n = len(grid)
+    a = np.frombuffer("".join("".join(row) for row in grid).encode("latin-1"), dtype=np.uint8).reshape(n, n).copy()
+    a[a == 32] = 0
+    return a
+
+def _across_feasible(a, word):
+    # boolean map (n, n-L+1): True where the word fits across starting at (r, c)
+    n = a.shape[0]; L = len(word)
+    occ = a != 0
+    wv = np.frombuffer(word.encode("latin-1"), dtype=np.uint8)
+    win = sliding_window_view(a, L, axis=1)
+    ok = ((win == 0) | (win == wv)).all(axis=-1)
+    # occupancy of the rows above and below (a [1, 0, 1] vertical convolution)
+    side = np.zeros_like(occ)
+    side[1:] |= occ[:-1]; side[:-1] |= occ[1:]
+    ok &= ~sliding_window_view(side & ~occ, L, axis=1).any(axis=-1)
+    # the cells just before and after the word must be empty
+    padded = np.zeros((n, n + 2), dtype=bool); padded[:, 1:-1] = occ
+    ok &= ~padded[:, :n-L+1]
+    ok &= ~padded[:, L+1:]
+    return ok
+
+def all_fitting_positions(grid, word):
+    """Every (r, c, dr, dc) where fits(grid, word, r, c, dr, dc) holds."""
+    n = len(grid); L = len(word)
+    if L > n:
+        return []
+    try:
+        if load_numpy() is None:
+            raise ImportError
+        a = grid_to_array(grid)
+        across = _across_feasible(a, word)
+    except (ImportError, UnicodeEncodeError):
+        # no numpy, or letters outside latin-1: one fits() call per position
+        return [(rr, cc, dr, dc) for rr in range(n) for cc in range(n) for dr, dc in ((0, 1), (1, 0))
+                if fits(grid, word, rr, cc, dr, dc)]
+    rs, cs = np.nonzero(across)
+    positions = [(int(r), int(c), 0, 1) for r, c in zip(rs, cs)]
+    # down is across on the transposed board
+    cs, rs = np.nonzero(_across_feasible(np.ascontiguousarray(a.T), word))
+    positions += [(int(r), int(c), 1, 0) for r, c in zip(rs, cs)]
+    return positions
+
+RANDOM_ATTEMPTS = 200
+RANDOM_TIME_LIMIT = 2.0
+
+def try_generate_grid_for_words(words, backend=None, stats=None, n=None, time_limit=RANDOM_TIME_LIMIT, index=None, cancel=None):
+    # cancel: optional callable, checked before every restart; True gives up (status "limit")
+    n = n or GRID_SIZE
+    words_sorted = sorted(words, key=lambda w: -len(w["answer"]))
+    orientations = [(0, 1), (1, 0)]
+    first = words_sorted[0]["answer"]
+    if len(first) > n:
+        # the longest word can never fit, no amount of restarts will help
+        if stats is not None:
+            stats.update(status="infeasible", attempts=0)
+        return None, None
+    t_start = time.perf_counter()
+    for attempt in range(RANDOM_ATTEMPTS):
+        # restarts cost more on big grids and long lists, so the budget is also bounded in time
+        if attempt and (time.perf_counter() - t_start > time_limit or (cancel is not None and cancel())):
+            break
+        grid = empty_grid(n, backend)
+        letter_index = {}
+        placements = []
+        swaps = []
+        # any in-bounds position fits on an empty grid: draw one instead of probing at random
+        dr, dc = random.choice(orientations)
+        r = random.randint(0, n - 1 - dr*(len(first)-1)); c = random.randint(0, n - 1 - dc*(len(first)-1))
+        place_word_on_grid(grid, first, r, c, dr, dc, letter_index)
+        placements.append(Placement(first, words_sorted[0]["clue"], r, c, dr, dc))
+        ok = True
+        for wobj in words_sorted[1:]:
+            word = wobj["answer"]
+            placed_this = False
+            # only the cells holding a letter of this word can be crossing points
+            cands = crossing_candidates(letter_index, word)
+            random.shuffle(cands)
+            for r0, c0, idx in cands:
+                for dr, dc in orientations:
+                    start_r = r0 - dr*idx; start_c = c0 - dc*idx
+                    if fits(grid, word, start_r, start_c, dr, dc):
+                        place_word_on_grid(grid, word, start_r, start_c, dr, dc, letter_index)
+                        placements.append(Placement(word, wobj["clue"], start_r, start_c, dr, dc))
+                        placed_this = True; break
+                if placed_this: break
+            if placed_this: continue
+            if index is not None:
+                # swap a word that crosses nothing for a bank word that does (word_index.PatternIndex)
+                alt = index.fit_word(grid, exclude={pl.word for pl in placements} | {w["answer"] for w in words_sorted})
+                if alt is not None:
+                    q, rpos, cpos, drpos, dcpos = alt
+                    alt_word = normalize_answer(q["answer"])
+                    place_word_on_grid(grid, alt_word, rpos, cpos, drpos, dcpos, letter_index)
+                    placements.append(Placement(alt_word, q["clue"], rpos, cpos, drpos, dcpos))
+                    swaps.append((wobj, q))
+                    continue
+            all_positions = all_fitting_positions(grid, word)
+            if all_positions:
+                rpos, cpos, drpos, dcpos = random.choice(all_positions)
+                place_word_on_grid(grid, word, rpos, cpos, drpos, dcpos, letter_index)
+                placements.append(Placement(word, wobj["clue"], rpos, cpos, drpos, dcpos))
+            else:
+                ok = False; break
+        if ok:
+            if stats is not None:
+                stats.update(status="ok", attempts=attempt + 1, swaps=swaps)
+            return grid, placements
+    if stats is not None:
+        stats.update(status="limit", attempts=attempt + 1)
+    return None, None
+
+# --- backtracking engine ---
+BACKTRACK_NODE_LIMIT = 20000
+BACKTRACK_TIME_LIMIT = 2.0
+# free-standing spots tried for a word that cannot cross anything
+BACKTRACK_FREE_SPOTS = 8
+# crossings are only counted up to this many when choosing the next word; past it a
+# word is "unconstrained" and the static order decides
+BACKTRACK_MRV_CAP = 6
+
+class _SearchLimit(Exception):
+    pass
+
+def backtrack_generate_grid_for_words(words, n=None, seed=None, node_limit=BACKTRACK_NODE_LIMIT,
+                                      time_limit=BACKTRACK_TIME_LIMIT, stats=None, cancel=None):
+    """Depth-first layout search with an undo log instead of random restarts.
+
+    The next word is always the one with the fewest legal crossings (ties go to
+    the word sharing letters with the fewest others). A word that can no longer
+    cross anything is placed free-standing, like the random engine's fallback,
+    and a branch is cut as soon as such a word has no free spot left.
+    Returns (grid, placements) like try_generate_grid_for_words, or (None, None).
+    The search is not complete: a word that can cross something is only tried at
+    crossings, and a free-standing word at BACKTRACK_FREE_SPOTS spots. So if a dict
+    is passed as stats it receives "status" "ok", "infeasible" only when nothing was
+    skipped and the whole search space was tried, else "limit" (node/time budget
+    ran out, or the skipped positions may hold a layout: retry with another seed),
+    plus "nodes", "attempts" (anchor positions tried) and "seconds". cancel, if given,
+    is a callable polled every 64 nodes; once it returns True the search stops as "limit".
+    """
+    n = n or GRID_SIZE
+    # without an explicit seed, follow the global random state so random.seed() reproduces runs
+    rng = random.Random(seed if seed is not None else random.random())
+    t_start = time.perf_counter()
+    answers = [w["answer"] for w in words]
+    clues = [w["clue"] for w in words]
+    k = len(answers)
+    letters = [set(a) for a in answers]
+    links = [sum(1 for j in range(k) if j != i and letters[i] & letters[j]) for i in range(k)]
+    grid = BitGrid(n)
+    # open crossing points: letter -> {(r, c): (dr, dc) a new word may cross that cell in}.
+    # A cell drops out once two words cross it, so only real candidates are ever tested.
+    open_cells = {}
+    placed = []
+    counter = {"nodes": 0, "anchors": 0, "skipped": False}
+
+    def finish(status, result):
+        if stats is not None:
+            stats.update(status=status, nodes=counter["nodes"], attempts=counter["anchors"],
+                         seconds=time.perf_counter() - t_start)
+        return result
+
+    if not answers or any(len(a) > n or not a for a in answers):
+        return finish("infeasible", (None, None))
+
+    def place(i, r, c, dr, dc):
+        # returns the undo log: cells filled, and crossing points used up by this word
+        word = answers[i]
+        crossed = []
+        for j, ch in enumerate(word):
+            cell = (r + dr*j, c + dc*j)
+            if grid.cells[cell[0]][cell[1]] != " ":
+                crossed.append((ch, cell, open_cells[ch].pop(cell, None)))
+        added = grid.place(word, r, c, dr, dc)
+        for rr, cc in added:
+            open_cells.setdefault(grid.cells[rr][cc], {})[(rr, cc)] = (dc, dr)
+        placed.append(Placement(word, clues[i], r, c, dr, dc))
+        return added, crossed
+
+    def undo(log):
+        added, crossed = log
+        for rr, cc in added:
+            del open_cells[grid.cells[rr][cc]][(rr, cc)]
+            grid.clear_cell(rr, cc)
+        for ch, cell, d in crossed:
+            if d is not None:
+                open_cells[ch][cell] = d
+        placed.pop()
+
+    # a position that fails stays failed while letters are only added, so failures found at a
+    # node are remembered for its whole subtree and forgotten when the node returns
+    dead = set()
+
+    def crossings(i, limit=None, failed=None):
+        # legal crossing positions for word i; stops early once `limit` have been found
+        word = answers[i]; seen = set(); out = []
+        for idx, ch in enumerate(word):
+            cells = open_cells.get(ch)
+            if not cells:
+                continue
+            for (r0, c0), (dr, dc) in cells.items():
+                pos = (r0 - dr*idx, c0 - dc*idx, dr, dc)
+                if pos in seen: continue
+                seen.add(pos)
+                key = (i, pos)
+                if key in dead: continue
+                if grid.fits(word, pos[0], pos[1], dr, dc):
+                    out.append(pos)
+                    if limit is not None and len(out) >= limit:
+                        return out
+                elif failed is not None:
+                    dead.add(key); failed.append(key)
+        return out
+
+    def search(remaining):
+        counter["nodes"] += 1
+        if counter["nodes"] > node_limit or time.perf_counter() - t_start > time_limit:
+            raise _SearchLimit()
+        if cancel is not None and not counter["nodes"] & 63 and cancel():
+            raise _SearchLimit()
+        if not remaining:
+            return True
+        failed = []
+        try:
+            return expand(remaining, failed)
+        finally:
+            dead.difference_update(failed)
+
+    def expand(remaining, failed):
+        best = None; stranded = []
+        # remaining is ordered by links, so on equal counts the earlier word wins and a
+        # word only has to be counted up to the current best
+        for i in remaining:
+            cands = crossings(i, best[0] if best else BACKTRACK_MRV_CAP, failed)
+            if cands:
+                if best is None or len(cands) < best[0]:
+                    best = (len(cands), i)
+                    if best[0] == 1:
+                        break  # a forced move: nothing can be more constrained
+            elif not any(letters[i] & letters[j] for j in remaining if j != i):
+                # no crossing now and no unplaced word to cross later: it can only stand alone
+                stranded.append(i)
+        # prune: a stranded word with no free spot at all sinks this branch
+        for i in stranded:
+            if not all_fitting_positions(grid, answers[i]):
+                return False
+        if best is None:
+            # nothing can attach: place the most constrained word free-standing, as the
+            # random engine's fallback does, trying a few spots
+            i = min(remaining, key=lambda j: (links[j], -len(answers[j])))
+            spots = all_fitting_positions(grid, answers[i])
+            rng.shuffle(spots)
+            rest = [j for j in remaining if j != i]
+            if len(spots) > BACKTRACK_FREE_SPOTS:
+                counter["skipped"] = True
+            for r, c, dr, dc in spots[:BACKTRACK_FREE_SPOTS]:
+                log = place(i, r, c, dr, dc)
+                if search(rest):
+                    return True
+                undo(log)
+            return False
+        i = best[1]
+        counter["skipped"] = True  # its free-standing spots are never tried
+        cands = crossings(i, None, failed)
+        rng.shuffle(cands)
+        rest = [j for j in remaining if j != i]
+        for r, c, dr, dc in cands:
+            log = place(i, r, c, dr, dc)
+            if search(rest):
+                return True
+            undo(log)
+        return False
+
+    # anchor: the best-connected (then longest) word, across; down is the same search transposed
+    first = max(range(k), key=lambda i: (links[i], len(answers[i])))
+    L = len(answers[first]); mid = n // 2
+    anchors = [(r, c) for r in range(n) for c in range(n - L + 1)]
+    anchors.sort(key=lambda p: (abs(p[0] - mid) + abs(p[1] + L // 2 - mid), rng.random()))
+    rest = sorted((j for j in range(k) if j != first), key=lambda j: links[j])
+    try:
+        for r, c in anchors:
+            counter["anchors"] += 1
+            log = place(first, r, c, 0, 1)
+            if search(rest):
+                return finish("ok", ([row[:] for row in grid.cells], list(placed)))
+            undo(log)
+    except _SearchLimit:
+        return finish("limit", (None, None))
+    return finish("limit" if counter["skipped"] else "infeasible", (None, None))
+
+# "random" by default: the benchmark suite has it at the same success rate as "backtrack" and
+# about 9x faster on large grids (40x40, 50 words: p50 2.1 ms against 19.5 ms)
+GENERATOR_ENGINE = "random"
+ENGINES = {
+    "random": lambda words, **kw: try_generate_grid_for_words(words, backend=kw.get("backend"), stats=kw.get("stats"), n=kw.get("n"),
+                                                              cancel=kw.get("cancel")),
+    "backtrack": backtrack_generate_grid_for_words,
+}
+
+def generate_grid(words, engine=None, **kw):
+    # same (grid, placements) contract whichever engine is selected
+    return ENGINES[engine or GENERATOR_ENGINE](words, **kw)
+
+# --- parallel generation ---
+PARALLEL_WORKERS = os.cpu_count() or 1
+PARALLEL_DEADLINE = 3.0
+# races that can run at once (the prefetch thread and the GUI thread each run one)
+CANCEL_SLOTS = 16
+_POOL = None
+_POOL_WORKERS = 0
+# the prefetch thread and the GUI thread both race puzzles on the pool
+_POOL_LOCK = threading.Lock()
+# shared with the workers: a race owns a slot holding its id while it runs; its attempts stop as
+# soon as the slot holds anything else
+_CANCEL_FLAGS = None
+_FREE_SLOTS = []
+_RACE_IDS = itertools.count(1)
+
+def _init_worker(flags):
+    global _CANCEL_FLAGS
+    _CANCEL_FLAGS = flags
+
+def _get_pool(workers):
+    # one long-lived pool: spawning processes per puzzle would cost more than generating it
+    global _POOL, _POOL_WORKERS, _CANCEL_FLAGS
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_WORKERS != workers:
+            _shutdown_pool()
+            _CANCEL_FLAGS = multiprocessing.RawArray("q", CANCEL_SLOTS); _FREE_SLOTS[:] = range(CANCEL_SLOTS)
+            _POOL = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(_CANCEL_FLAGS,))
+            _POOL_WORKERS = workers
+        return _POOL
+
+def _start_race():
+    # (flags, slot, race id) for a new race, or None when every slot is taken (it can't be cancelled)
+    with _POOL_LOCK:
+        if not _FREE_SLOTS or _CANCEL_FLAGS is None:
+            return None
+        slot = _FREE_SLOTS.pop(); race_id = next(_RACE_IDS)
+        _CANCEL_FLAGS[slot] = race_id
+        return _CANCEL_FLAGS, slot, race_id
+
+def _end_race(race):
+    # tells the race's running attempts to stop and frees its slot
+    if race is None:
+        return
+    flags, slot, _ = race
+    with _POOL_LOCK:
+        flags[slot] = 0
+        if flags is _CANCEL_FLAGS:
+            _FREE_SLOTS.append(slot)
+
+def _shutdown_pool():
+    global _POOL, _POOL_WORKERS
+    if _POOL is not None:
+        _POOL.shutdown(wait=False, cancel_futures=True)
+    _POOL = None; _POOL_WORKERS = 0
+
+def shutdown_pool():
+    with _POOL_LOCK:
+        _shutdown_pool()
+
+atexit.register(shutdown_pool)
+
+def _seeded_attempt(words, seed, engine, time_limit, n=None, race=None):
+    # runs in a worker process; the seed makes every attempt independent and reproducible.
+    # race: (slot, race id) in the worker's cancel flags
+    random.seed(seed)
+    cancel = None
+    if race is not None and _CANCEL_FLAGS is not None:
+        flags = _CANCEL_FLAGS; slot, race_id = race
+        cancel = lambda: flags[slot] != race_id
+    if engine == "backtrack":
+        return backtrack_generate_grid_for_words(words, n=n, seed=seed, time_limit=time_limit, cancel=cancel)
+    return generate_grid(words, engine, n=n, cancel=cancel)
+
+def layout_crossings(placements):
+    # number of cells shared by two words: more crossings = a tighter, better puzzle
+    seen = set(); shared = 0
+    for pl in placements:
+        for i in range(len(pl.word)):
+            cell = (pl.r + pl.dr*i, pl.c + pl.dc*i)
+            if cell in seen: shared += 1
+            else: seen.add(cell)
+    return shared
+
+def parallel_generate_grid(words, workers=None, attempts=None, deadline=PARALLEL_DEADLINE,
+                           engine=None, mode="first", seed=None, n=None):
+    """Race independent seeded attempts on a process pool.
+
+    mode="first" returns the first valid layout, mode="best" the layout with
+    the most crossings that finished before the deadline. Once the race is
+    decided, queued attempts are cancelled and running ones stop at their next
+    check of the race's shared cancel flag. Falls back to a single in-process
+    attempt if the pool cannot be used.
+    """
+    workers = workers or PARALLEL_WORKERS
+    attempts = attempts or workers
+    engine = engine or GENERATOR_ENGINE
+    base = seed if seed is not None else random.randrange(1 << 30)
+    words = [as_question(w) for w in words]
+    race = None
+    try:
+        pool = _get_pool(workers)
+        race = _start_race()
+        futures = [pool.submit(_seeded_attempt, words, base + i, engine, deadline, n, race and race[1:]) for i in range(attempts)]
+    except Exception:
+        traceback.print_exc()
+        _end_race(race)
+        shutdown_pool()
+        return _seeded_attempt(words, base, engine, deadline, n)
+    best = (None, None); best_score = -1
+    try:
+        for fut in as_completed(futures, timeout=deadline):
+            try:
+                grid, placements = fut.result()
+            except Exception:
+                traceback.print_exc()
+                continue
+            if grid is None:
+                continue
+            if mode == "first":
+                best = (grid, placements); break
+            score = layout_crossings(placements)
+            if score > best_score:
+                best = (grid, placements); best_score = score
+    except FuturesTimeout:
+        pass
+    finally:
+        for fut in futures:
+            fut.cancel()
+        _end_race(race)
+    return best
+
+def create_crossword_for_student(question_pool, pick_count=WORDS_TO_PICK, engine=None, workers=None, cache=None, grid_size=None,
+                                 index=None, sampler=None, exclude=None):
+    n = grid_size or GRID_SIZE
+    if sampler is not None and len(sampler) >= pick_count:
+        # sampler: weighted draws over question_pool, e.g. sampler.AdaptiveSampler;
+        # exclude: question_key()s to avoid if possible, e.g. seen_store.SeenSet
+        pick = [as_question(q) for q in sampler.sample(pick_count, exclude=exclude)]
+    else:
+        pool = question_pool if len(question_pool) >= pick_count else DUMMY_QUESTIONS
+        # sample positions, not records: the pool is neither copied nor touched
+        pick = [as_question(pool[i]) for i in random.sample(range(len(pool)), k=pick_count)]
+    # cache: anything with lookup(words, n) -> (layout or None, full) and put(words, n, grid, placements),
+    # e.g. layout_cache.LayoutCache; until the answer set has all its variants a new layout is generated
+    hit = None
+    if cache is not None:
+        hit, full = cache.lookup(pick, n)
+        if full:
+            return pick, hit[0], hit[1]
+    if workers and workers > 1:
+        grid, placements = parallel_generate_grid(pick, workers=workers, engine=engine, n=n)
+    else:
+        # neither engine searches exhaustively, so a failure is retried with fresh random choices
+        for _ in range(6):
+            grid, placements = generate_grid(pick, engine, n=n)
+            if grid is not None:
+                break
+    if grid is None and hit is not None:
+        return pick, hit[0], hit[1]
+    if grid is None and index is not None:
+        # index: word_index.PatternIndex over the bank; keep the grid and replace the words
+        # that will not cross with bank words that fit an existing crossing
+        stats = {}
+        grid, placements = try_generate_grid_for_words(pick, n=n, stats=stats, index=index)
+        if grid is not None:
+            for old, new in stats["swaps"]:
+                pick[pick.index(old)] = as_question(new)
+    if cache is not None and grid is not None:
+        cache.put(pick, n, grid, placements)
+    return pick, grid, placements
@@ -0,0 +1,99 @@
+# layout_cache.py
+# CROSSWORD PUZZLE — persistent layout cache keyed by the puzzle's answer set.
+# Backed by SQLite so several stations sharing one install directory can use it at once.
+
+import hashlib
+import json
+import random
+import sqlite3
+import time
+import traceback
+from contextlib import contextmanager
+
+from crossword_gen import Placement, normalize_answer
+
+LAYOUT_CACHE_FILE = "layout_cache.sqlite"
+
+def layout_key(words, n, seed=None):
+    # content address: the same answers (in any order) on the same grid size share a key
+    answers = sorted(normalize_answer(w["answer"]) for w in words)
+    raw = "|".join(answers) + f"#{n}" + ("" if seed is None else f"#{seed}")
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+class LayoutCache:
+    """Up to max_variants layouts per answer set, least recently used sets evicted past max_keys."""
+    def __init__(self, path=LAYOUT_CACHE_FILE, max_keys=5000, max_variants=4):
+        self.path = path; self.max_keys = max_keys; self.max_variants = max_variants
+        try:
+            with self._connect() as con:
+                con.execute("CREATE TABLE IF NOT EXISTS keys (key TEXT PRIMARY KEY, last_used REAL)")
+                con.execute("CREATE TABLE IF NOT EXISTS layouts (key TEXT, variant INTEGER, layout TEXT, PRIMARY KEY (key, variant))")
+                con.execute("CREATE INDEX IF NOT EXISTS keys_lru ON keys (last_used)")
+        except Exception:
+            traceback.print_exc()
+
+    @contextmanager
+    def _connect(self):
+        # a short-lived connection per call is safe across threads and processes; the default
+        # rollback journal (not WAL) also works when the directory is on a network share
+        con = sqlite3.connect(self.path, timeout=10)
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    def get(self, words, n, seed=None):
+        """A random stored (grid, placements) for these words, or None."""
+        return self.lookup(words, n, seed)[0]
+
+    def lookup(self, words, n, seed=None):
+        """(a random stored (grid, placements) or None, whether the answer set has all max_variants layouts).
+
+        Until it is full the caller should generate anyway and put() the result, so the same
+        words do not always come back in the same layout."""
+        key = layout_key(words, n, seed)
+        try:
+            with self._connect() as con:
+                rows = con.execute("SELECT layout FROM layouts WHERE key = ?", (key,)).fetchall()
+                if not rows:
+                    return None, False
+                con.execute("UPDATE keys SET last_used = ? WHERE key = ?", (time.time(), key))
+        except Exception:
+            traceback.print_exc()
+            return None, False
+        return self._decode(random.choice(rows)[0], words), len(rows) >= self.max_variants
+
+    def _decode(self, layout, words):
+        data = json.loads(layout)
+        grid = [list(row) for row in data["grid"]]
+        # clues are not part of the key: hand this pick's clues back out by answer
+        clues = {}
+        for w in words:
+            clues.setdefault(normalize_answer(w["answer"]), []).append(w["clue"])
+        placements = []
+        for word, r, c, dr, dc in data["placements"]:
+            options = clues.get(word) or ["?"]
+            placements.append(Placement(word, options.pop(0) if len(options) > 1 else options[0], r, c, dr, dc))
+        return grid, placements
+
+    def put(self, words, n, grid, placements, seed=None):
+        key = layout_key(words, n, seed)
+        layout = json.dumps({
+            "grid": ["".join(row) for row in grid],
+            "placements": [[pl.word, pl.r, pl.c, pl.dr, pl.dc] for pl in placements],
+        })
+        try:
+            with self._connect() as con:
+                rows = con.execute("SELECT variant, layout FROM layouts WHERE key = ?", (key,)).fetchall()
+                if len(rows) < self.max_variants and all(l != layout for _, l in rows):
+                    variant = max((v for v, _ in rows), default=-1) + 1
+                    con.execute("INSERT OR IGNORE INTO layouts (key, variant, layout) VALUES (?, ?, ?)", (key, variant, layout))
+                con.execute("INSERT OR REPLACE INTO keys (key, last_used) VALUES (?, ?)", (key, time.time()))
+                excess = con.execute("SELECT COUNT(*) FROM keys").fetchone()[0] - self.max_keys
+                if excess > 0:
+                    old = [k for (k,) in con.execute("SELECT key FROM keys ORDER BY last_used LIMIT ?", (excess,))]
+                    con.executemany("DELETE FROM layouts WHERE key = ?", [(k,) for k in old])
+                    con.executemany("DELETE FROM keys WHERE key = ?", [(k,) for k in old])
+        except Exception:
+            traceback.print_exc()
@@ -0,0 +1,438 @@
+# leaderboard_store.py
+# CROSSWORD PUZZLE — leaderboard storage (no Qt, no pandas).
+# Every backend keeps rows with LEADERBOARD_COLUMNS and ranks them by Score (high first), then
+# Name. "sqlite" is the default: one indexed row per finish, so adding a score, saving feedback
+# and reading the top five no longer rewrite the whole file. "csv" is the old leaderboard.csv
+# (rewritten on every change), kept for installs that edit the file by hand. "journal" keeps
+# flat files but appends one JSONL record per change and folds them into the sorted CSV now and then.
+#   store = open_leaderboard("sqlite", "leaderboard.sqlite", csv_path="leaderboard.csv")
+
+import csv
+import heapq
+import json
+import os
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from contextlib import contextmanager
+
+LEADERBOARD_COLUMNS = ["EntryID", "Name", "Class", "Section", "Score", "TimeSeconds", "Rating", "FeedbackWord", "Heart"]
+LEADERBOARD_DB_FILE = "leaderboard.sqlite"
+HEART = "❤️"
+
+def _int(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+def clean_row(row):
+    """A full leaderboard row from a partial/loose one: every column present, Score and TimeSeconds ints."""
+    out = {col: row.get(col) for col in LEADERBOARD_COLUMNS}
+    for col in LEADERBOARD_COLUMNS:
+        if out[col] is None or out[col] != out[col]:  # missing or NaN from an old pandas-written file
+            out[col] = ""
+    out["EntryID"] = str(out["EntryID"] or uuid.uuid4())
+    out["Score"] = _int(out["Score"]); out["TimeSeconds"] = _int(out["TimeSeconds"])
+    rating = str(out["Rating"]).strip()
+    out["Rating"] = str(_int(rating)) if rating else ""  # pandas wrote ratings back as "9.0"
+    for col in ("Name", "Class", "Section", "FeedbackWord", "Heart"):
+        out[col] = str(out[col])
+    return out
+
+def rank_key(row):
+    return (-row["Score"], row["Name"])
+
+def rating_stats(rows):
+    """(hearts given, average of the 1-10 ratings or None) over rows."""
+    hearts = sum(1 for r in rows if str(r["Heart"]).strip() == HEART)
+    ratings = [int(r["Rating"]) for r in rows if str(r["Rating"]).isdigit() and 1 <= int(r["Rating"]) <= 10]
+    return hearts, (round(sum(ratings) / len(ratings), 1) if ratings else None)
+
+class LeaderboardStore:
+    """What every backend provides; rows are dicts over LEADERBOARD_COLUMNS."""
+    def add(self, row):
+        """Store a new row; returns its EntryID."""
+        raise NotImplementedError
+
+    def update(self, entry_id, **fields):
+        """Change columns of one entry; False if there is no such entry."""
+        raise NotImplementedError
+
+    def remove(self, entry_ids):
+        raise NotImplementedError
+
+    def top(self, n=None):
+        """The n best rows (all when n is None), best first."""
+        raise NotImplementedError
+
+    def find(self, entry_id=None, name=None):
+        """EntryIDs of the entry with entry_id, or failing that of every entry named name."""
+        rows = self.top()
+        if entry_id:
+            hits = [r["EntryID"] for r in rows if r["EntryID"] == str(entry_id)]
+            if hits:
+                return hits
+        return [r["EntryID"] for r in rows if name and r["Name"] == str(name)]
+
+    def stats(self):
+        return rating_stats(self.top())
+
+    def clear(self):
+        raise NotImplementedError
+
+    def export_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=LEADERBOARD_COLUMNS)
+            w.writeheader(); w.writerows(self.top())
+
+def read_csv_rows(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return [clean_row(row) for row in csv.DictReader(f)]
+
+def write_csv_rows(path, rows):
+    # sorted, through a temporary file, so a reader never sees half a leaderboard
+    tmp = path + ".tmp"
+    with open(tmp, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=LEADERBOARD_COLUMNS)
+        w.writeheader(); w.writerows(sorted(rows, key=rank_key))
+    os.replace(tmp, path)
+
+class CsvLeaderboardStore(LeaderboardStore):
+    """The whole leaderboard in one sorted CSV, rewritten on every change."""
+    def __init__(self, path):
+        self.path = path
+        if not os.path.exists(path):
+            self._save([])
+
+    def _save(self, rows):
+        write_csv_rows(self.path, rows)
+
+    def top(self, n=None):
+        rows = sorted(read_csv_rows(self.path), key=rank_key)
+        return rows if n is None else rows[:n]
+
+    def add(self, row):
+        row = clean_row(row)
+        self._save(read_csv_rows(self.path) + [row])
+        return row["EntryID"]
+
+    def update(self, entry_id, **fields):
+        rows = read_csv_rows(self.path); hit = False
+        for i, row in enumerate(rows):
+            if row["EntryID"] == str(entry_id):
+                rows[i] = clean_row({**row, **fields}); hit = True
+        if hit:
+            self._save(rows)
+        return hit
+
+    def remove(self, entry_ids):
+        ids = {str(e) for e in entry_ids}
+        rows = read_csv_rows(self.path)
+        kept = [r for r in rows if r["EntryID"] not in ids]
+        self._save(kept)
+        return len(rows) - len(kept)
+
+    def clear(self):
+        self._save([])
+
+class SqliteLeaderboardStore(LeaderboardStore):
+    """One row per entry, EntryID as primary key and an index in rank order."""
+    def __init__(self, path=LEADERBOARD_DB_FILE, csv_path=None, wal=True):
+        self.path = path
+        try:
+            with self._connect() as con:
+                if wal:
+                    # readers (the top-five panel, the admin table) no longer wait on a finishing
+                    # student's write; needs the database on a local disk, not a network share
+                    con.execute("PRAGMA journal_mode=WAL")
+                con.execute("CREATE TABLE IF NOT EXISTS leaderboard (EntryID TEXT PRIMARY KEY, Name TEXT, Class TEXT, "
+                            "Section TEXT, Score INTEGER, TimeSeconds INTEGER, Rating TEXT, FeedbackWord TEXT, Heart TEXT)")
+                con.execute("CREATE INDEX IF NOT EXISTS leaderboard_rank ON leaderboard (Score DESC, Name)")
+                con.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            if csv_path:
+                self.migrate_csv(csv_path)
+        except Exception:
+            traceback.print_exc()
+
+    @contextmanager
+    def _connect(self):
+        # short-lived connections, as in layout_cache and seen_store
+        con = sqlite3.connect(self.path, timeout=10)
+        con.row_factory = sqlite3.Row
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    def migrate_csv(self, csv_path):
+        """Import an existing leaderboard.csv once; the CSV is left in place as a backup."""
+        with self._connect() as con:
+            con.execute("BEGIN IMMEDIATE")
+            if con.execute("SELECT 1 FROM meta WHERE key = 'csv_migrated'").fetchone():
+                return 0
+            rows = read_csv_rows(csv_path)
+            con.executemany(f"INSERT OR IGNORE INTO leaderboard VALUES ({', '.join('?' * len(LEADERBOARD_COLUMNS))})",
+                            [tuple(r[c] for c in LEADERBOARD_COLUMNS) for r in rows])
+            con.execute("INSERT INTO meta (key, value) VALUES ('csv_migrated', ?)", (os.path.abspath(csv_path),))
+        return len(rows)
+
+    def add(self, row):
+        row = clean_row(row)
+        with self._connect() as con:
+            con.execute(f"INSERT INTO leaderboard VALUES ({', '.join('?' * len(LEADERBOARD_COLUMNS))})",
+                        tuple(row[c] for c in LEADERBOARD_COLUMNS))
+        return row["EntryID"]
+
+    def update(self, entry_id, **fields):
+        fields = {k: v for k, v in fields.items() if k in LEADERBOARD_COLUMNS and k != "EntryID"}
+        if not fields:
+            return False
+        values = clean_row(fields)
+        with self._connect() as con:
+            cur = con.execute(f"UPDATE leaderboard SET {', '.join(f'{k} = ?' for k in fields)} WHERE EntryID = ?",
+                              [values[k] for k in fields] + [str(entry_id)])
+        return cur.rowcount > 0
+
+    def remove(self, entry_ids):
+        with self._connect() as con:
+            cur = con.executemany("DELETE FROM leaderboard WHERE EntryID = ?", [(str(e),) for e in entry_ids])
+        return cur.rowcount
+
+    def top(self, n=None):
+        with self._connect() as con:
+            rows = con.execute("SELECT * FROM leaderboard ORDER BY Score DESC, Name LIMIT ?", (-1 if n is None else n,)).fetchall()
+        return [dict(r) for r in rows]
+
+    def find(self, entry_id=None, name=None):
+        with self._connect() as con:
+            if entry_id:
+                hits = con.execute("SELECT EntryID FROM leaderboard WHERE EntryID = ?", (str(entry_id),)).fetchall()
+                if hits:
+                    return [r[0] for r in hits]
+            if not name:
+                return []
+            return [r[0] for r in con.execute("SELECT EntryID FROM leaderboard WHERE Name = ?", (str(name),))]
+
+    def stats(self):
+        with self._connect() as con:
+            return rating_stats([dict(r) for r in con.execute("SELECT Heart, Rating FROM leaderboard WHERE Heart != '' OR Rating != ''")])
+
+    def clear(self):
+        with self._connect() as con:
+            con.execute("DELETE FROM leaderboard")
+
+# --- flat files: sorted snapshot + append-only journal ---
+JOURNAL_SUFFIX = ".journal"
+# journal records before a station folds them into the snapshot
+COMPACT_AFTER = 500
+# a compaction lock older than this is left over from a crashed station
+STALE_LOCK_SECONDS = 120
+# appends hold their lock for one short write; older than this it is left over from a crash
+STALE_APPEND_LOCK_SECONDS = 10
+
+def apply_record(rows, record):
+    """Replay one journal record onto rows ({EntryID: row}).
+
+    Every record sets state rather than adjusting it, so replaying records that are already folded
+    into the snapshot (a reader racing a compaction) leaves the same rows."""
+    op = record.get("op")
+    if op == "add":
+        row = clean_row(record["row"]); rows[row["EntryID"]] = row
+    elif op == "update":
+        row = rows.get(record["id"])
+        if row is not None:
+            rows[record["id"]] = {**row, **record["fields"]}
+    elif op == "remove":
+        for entry_id in record["ids"]:
+            rows.pop(entry_id, None)
+    elif op == "clear":
+        rows.clear()
+
+def _file_id(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_mtime_ns)
+
+@contextmanager
+def _file_lock(path, stale, wait=True):
+    """Yields True once path could be created exclusively (False if wait is off and it is taken)."""
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) >= stale:
+                    os.remove(path)
+                    continue
+            except OSError:
+                continue  # released meanwhile
+            if not wait:
+                yield False
+                return
+            time.sleep(0.002)
+    try:
+        yield True
+    finally:
+        os.close(fd); os.remove(path)
+
+class JournalLeaderboardStore(LeaderboardStore):
+    """leaderboard.csv as a sorted snapshot plus leaderboard.csv.journal, one JSON record per change.
+
+    Writes append one line. Reads replay only the journal lines added since the last read. After
+    COMPACT_AFTER records a background thread folds the journal into a new snapshot: the journal is
+    renamed to .compacting (new writes start a fresh journal), snapshot + .compacting are written as
+    the new snapshot, then .compacting is deleted. Every append holds the append lock file from open
+    to close and the rename takes it too, so no write can land in a journal already being folded;
+    a second lock file keeps stations from compacting at once."""
+    def __init__(self, path, compact_after=COMPACT_AFTER):
+        self.path = path; self.compact_after = compact_after
+        self.journal = path + JOURNAL_SUFFIX
+        self.compacting = self.journal + ".compacting"
+        self.lock_path = path + ".lock"
+        self.append_lock_path = self.journal + ".lock"
+        self.rows = {}; self._mark = None; self._offset = 0; self._records = 0
+        self._lock = threading.Lock(); self._compactor = None
+        if not os.path.exists(path):
+            write_csv_rows(path, [])
+
+    # --- reading ---
+    def _snapshot_mark(self):
+        # the snapshot and .compacting files, and which journal file is current (not its size)
+        journal = _file_id(self.journal)
+        return _file_id(self.path), _file_id(self.compacting), journal and journal[:2]
+
+    def _replay(self, path, offset=0):
+        # records from offset up to the last complete line; returns the new offset
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset); data = f.read()
+        except FileNotFoundError:
+            return offset
+        end = data.rfind(b"\n") + 1  # a line still being written is read next time
+        for line in data[:end].splitlines():
+            try:
+                apply_record(self.rows, json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                continue  # torn record from a crash mid-append
+            self._records += 1
+        return offset + end
+
+    def _refresh(self):
+        with self._lock:
+            for _ in range(3):
+                mark = self._snapshot_mark()
+                if mark != self._mark:
+                    # compacted (or first read): start over from the snapshot
+                    self.rows = {r["EntryID"]: r for r in read_csv_rows(self.path)}
+                    self._replay(self.compacting)
+                    self._records = 0  # counts the live journal only
+                    self._offset = 0
+                self._offset = self._replay(self.journal, self._offset)
+                # a compaction in between means the tail came from another journal: read again
+                self._mark = mark if self._snapshot_mark() == mark else None
+                if self._mark is not None:
+                    break
+            return self.rows
+
+    def top(self, n=None):
+        rows = list(self._refresh().values())
+        rows = sorted(rows, key=rank_key) if n is None else heapq.nsmallest(n, rows, key=rank_key)
+        return [dict(r) for r in rows]
+
+    def find(self, entry_id=None, name=None):
+        rows = self._refresh()
+        if entry_id and str(entry_id) in rows:
+            return [str(entry_id)]
+        return [r["EntryID"] for r in rows.values() if name and r["Name"] == str(name)]
+
+    def stats(self):
+        return rating_stats(list(self._refresh().values()))
+
+    # --- writing ---
+    def _append(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with _file_lock(self.append_lock_path, STALE_APPEND_LOCK_SECONDS):
+            with open(self.journal, "a", encoding="utf-8") as f:
+                f.write(line)
+        self._refresh()  # counts this record along with any other station's
+        if self._records >= self.compact_after:
+            self.compact_in_background()
+
+    def add(self, row):
+        row = clean_row(row)
+        self._append({"op": "add", "row": row})
+        return row["EntryID"]
+
+    def update(self, entry_id, **fields):
+        fields = {k: v for k, v in fields.items() if k in LEADERBOARD_COLUMNS and k != "EntryID"}
+        if not fields or str(entry_id) not in self._refresh():
+            return False
+        values = clean_row(fields)
+        self._append({"op": "update", "id": str(entry_id), "fields": {k: values[k] for k in fields}})
+        return True
+
+    def remove(self, entry_ids):
+        rows = self._refresh()
+        ids = [e for e in map(str, entry_ids) if e in rows]
+        if ids:
+            self._append({"op": "remove", "ids": ids})
+        return len(ids)
+
+    def clear(self):
+        self._append({"op": "clear"})
+
+    # --- compaction ---
+    def compact_in_background(self):
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self._compact_quietly, name="leaderboard-compaction", daemon=True)
+        self._compactor.start()
+
+    def _compact_quietly(self):
+        try:
+            self.compact()
+        except Exception:
+            traceback.print_exc()
+
+    def compact(self):
+        """Fold the journal into a new sorted snapshot; False if another station holds the lock."""
+        with _file_lock(self.lock_path, STALE_LOCK_SECONDS, wait=False) as locked:
+            if not locked:
+                return False
+            # a .compacting file left by a crashed compaction is folded before the journal is touched
+            if not os.path.exists(self.compacting):
+                with _file_lock(self.append_lock_path, STALE_APPEND_LOCK_SECONDS):
+                    if not os.path.exists(self.journal):
+                        return True
+                    os.replace(self.journal, self.compacting)
+            rows = {r["EntryID"]: r for r in read_csv_rows(self.path)}
+            with open(self.compacting, "rb") as f:
+                for line in f:
+                    try:
+                        apply_record(rows, json.loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+            write_csv_rows(self.path, rows.values())
+            os.remove(self.compacting)
+            return True
+
+BACKENDS = {
+    "sqlite": lambda path, csv_path=None: SqliteLeaderboardStore(path or LEADERBOARD_DB_FILE, csv_path=csv_path),
+    "csv": lambda path, csv_path=None: CsvLeaderboardStore(csv_path or path),
+    "journal": lambda path, csv_path=None: JournalLeaderboardStore(csv_path or path),
+}
+
+def open_leaderboard(backend="sqlite", path=None, csv_path=None):
+    """A store from BACKENDS; csv_path is the legacy CSV (imported once by "sqlite")."""
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown leaderboard backend {backend!r}, expected one of {sorted(BACKENDS)}")
+    return BACKENDS[backend](path, csv_path=csv_path)
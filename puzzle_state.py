@@ -0,0 +1,80 @@
+# puzzle_state.py
+# CROSSWORD PUZZLE — one puzzle's solution, a player's letters and grading (no Qt, no pandas).
+# The solution and the entries are flat n*n arrays of code points (0 = block / empty cell) and each
+# placed word is a run of offsets into them, so every word is graded in one pass (in numpy when it
+# is installed). The grid widget only displays the result; recorded sessions can be graded offline:
+#   total, grades = score_entries(grid, placements, ["  CAT ...", ...])
+
+from array import array
+
+from crossword_gen import load_numpy
+
+# points for a word by the number of wrong letters in it; more than 8 wrong still scores 1
+SCORE_BY_WRONG = {0: 25, 1: 18, 2: 15, 3: 12, 4: 10, 5: 8, 6: 6, 7: 4, 8: 2}
+
+def word_score(wrong):
+    return SCORE_BY_WRONG.get(wrong, 1)
+
+class PuzzleState:
+    """Solution and entries of one puzzle, plus the cell offsets of each placed word."""
+    def __init__(self, grid, placements=()):
+        n = len(grid)
+        self.n = n
+        self.solution = array("I", (0 if ch == " " else ord(ch) for row in grid for ch in row))
+        self.entries = array("I", [0]) * (n * n)
+        self.words = [self.offsets_of((pl.r + pl.dr*i, pl.c + pl.dc*i) for i in range(len(pl.word))) for pl in placements]
+
+    def offsets_of(self, cells):
+        n = self.n
+        return array("I", (r * n + c for r, c in cells))
+
+    def is_block(self, r, c):
+        return not self.solution[r * self.n + c]
+
+    def answer(self, r, c):
+        v = self.solution[r * self.n + c]
+        return chr(v) if v else " "
+
+    def get(self, r, c):
+        v = self.entries[r * self.n + c]
+        return chr(v) if v else ""
+
+    def set(self, r, c, ch):
+        self.entries[r * self.n + c] = ord(ch) if ch else 0
+
+    def fill(self, rows):
+        """Load a whole board of entries (strings or lists, " " or "" for empty) at once."""
+        self.entries = array("I", (0 if ch in (" ", "") else ord(ch) for row in rows for ch in row))
+        if len(self.entries) != len(self.solution):
+            raise ValueError(f"expected a {self.n}x{self.n} board of entries")
+
+    def grade(self, words=None):
+        """(wrong mask, wrong letters, score) for each word, placed words by default.
+
+        words is a list of offset arrays (see offsets_of); the mask has one byte per letter, 1 = wrong."""
+        words = self.words if words is None else words
+        if not words:
+            return []
+        np = load_numpy()
+        if np is not None:
+            flat = np.concatenate([np.frombuffer(w, dtype=np.uint32) for w in words]).astype(np.intp)
+            wrong = (np.frombuffer(self.entries, dtype=np.uint32)[flat] != np.frombuffer(self.solution, dtype=np.uint32)[flat])
+            lengths = np.fromiter((len(w) for w in words), dtype=np.intp, count=len(words))
+            starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            counts = np.add.reduceat(wrong, starts).tolist() if len(flat) else [0] * len(words)
+            mask = wrong.astype(np.uint8).tobytes()
+            return [(mask[s:s+L], k, word_score(k)) for s, L, k in zip(starts.tolist(), lengths.tolist(), counts)]
+        entries = self.entries; solution = self.solution
+        out = []
+        for w in words:
+            mask = bytes(entries[i] != solution[i] for i in w)
+            k = sum(mask)
+            out.append((mask, k, word_score(k)))
+        return out
+
+def score_entries(grid, placements, rows):
+    """Grade one recorded board: (total score, grade per placement)."""
+    state = PuzzleState(grid, placements)
+    state.fill(rows)
+    grades = state.grade()
+    return sum(score for _, _, score in grades), grades
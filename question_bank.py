@@ -0,0 +1,169 @@
+# question_bank.py
+# CROSSWORD PUZZLE — question bank loading (no Qt, no pandas).
+# Banks are .xlsx / .csv / .json / .jsonl files with "clue" and "answer" columns (and optionally "id").
+# load_question_bank() keeps a compiled copy next to the source (<bank>.qbc) and reloads that
+# directly while the source is unchanged, so large workbooks are only parsed once.
+
+import csv
+import hashlib
+import json
+import os
+import struct
+import traceback
+from array import array
+
+from crossword_gen import Question, normalize_answer
+
+CACHE_SUFFIX = ".qbc"
+CACHE_MAGIC = b"QBC1"
+_SEP = "\x1f"  # unit separator: never appears in a clue typed into a spreadsheet
+
+# ids are stored as int64 in the compiled cache
+MAX_QUESTION_ID = (1 << 63) - 1
+
+def _explicit_id(value):
+    # a usable id from the bank's "id" column, or None (missing, not a whole number, out of range)
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        qid = int(value) if isinstance(value, int) else int(str(value).strip())
+    except ValueError:
+        try:
+            f = float(value)  # spreadsheets hand whole numbers back as 12.0
+        except (TypeError, ValueError):
+            return None
+        if not f.is_integer():
+            return None
+        qid = int(f)
+    return qid if 0 <= qid <= MAX_QUESTION_ID else None
+
+def _clean(rows):
+    # normalize answers, drop rows without a usable clue/answer, give every row a unique id
+    kept = []; used = set(); bad = dup = 0
+    for n, row in enumerate(rows, start=1):
+        row = {str(k).strip().lower(): v for k, v in row.items() if k is not None}
+        clue = str(row.get("clue") or "").strip().replace(_SEP, " ")
+        answer = normalize_answer(str(row.get("answer") or "").strip())
+        if not clue or not answer.isalpha():
+            continue
+        raw = row.get("id")
+        qid = _explicit_id(raw)
+        if qid is None and raw not in (None, ""):
+            bad += 1
+        elif qid in used:
+            qid = None; dup += 1  # the first row keeps the id
+        if qid is not None:
+            used.add(qid)
+        kept.append((n, qid, clue, answer))
+    # rows without an id of their own get their row number, or the lowest free id if that is taken
+    out = []; next_free = 1
+    for n, qid, clue, answer in kept:
+        if qid is None:
+            if n in used:
+                while next_free in used:
+                    next_free += 1
+                n = next_free
+            qid = n; used.add(qid)
+        out.append(Question(qid, clue, answer))
+    if bad or dup:
+        print(f"question bank: renumbered {bad} invalid and {dup} duplicate ids")
+    return out
+
+def _xlsx_rows(path):
+    # read_only mode streams rows instead of building the whole workbook in memory
+    import openpyxl
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = [str(h).strip() if h is not None else None for h in next(rows, ())]
+        for values in rows:
+            yield dict(zip(header, values))
+    finally:
+        wb.close()
+
+def load_questions(path):
+    """Parse a bank straight from its source file (no cache)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".xlsx", ".xlsm"):
+        return _clean(_xlsx_rows(path))
+    if ext == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            return _clean(csv.DictReader(f))
+    if ext == ".jsonl":
+        with open(path, encoding="utf-8") as f:
+            return _clean(json.loads(line) for line in f if line.strip())
+    if ext == ".json":
+        with open(path, encoding="utf-8") as f:
+            return _clean(json.load(f))
+    raise ValueError(f"unsupported question bank format: {path}")
+
+# --- compiled cache ---
+def _file_hash(path):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def write_compiled(cache_path, questions, source_stat, source_hash):
+    # layout: magic, header length, JSON header, then ids / clues / answers as three flat blocks
+    ids = array("q", (q["id"] for q in questions))
+    clues = _SEP.join(q["clue"] for q in questions).encode("utf-8")
+    answers = _SEP.join(q["answer"] for q in questions).encode("utf-8")
+    header = json.dumps({
+        "count": len(questions), "size": source_stat.st_size, "mtime_ns": source_stat.st_mtime_ns,
+        "hash": source_hash, "blocks": [len(ids) * ids.itemsize, len(clues), len(answers)],
+    }).encode("utf-8")
+    tmp = cache_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(CACHE_MAGIC); f.write(struct.pack("<I", len(header))); f.write(header)
+        f.write(ids.tobytes()); f.write(clues); f.write(answers)
+    os.replace(tmp, cache_path)
+
+def read_compiled_header(cache_path):
+    with open(cache_path, "rb") as f:
+        if f.read(4) != CACHE_MAGIC:
+            return None
+        (hlen,) = struct.unpack("<I", f.read(4))
+        return json.loads(f.read(hlen))
+
+def read_compiled(cache_path):
+    with open(cache_path, "rb") as f:
+        data = f.read()
+    if data[:4] != CACHE_MAGIC:
+        raise ValueError(f"not a compiled question bank: {cache_path}")
+    (hlen,) = struct.unpack_from("<I", data, 4)
+    header = json.loads(data[8:8+hlen])
+    pos = 8 + hlen
+    n_ids, n_clues, n_answers = header["blocks"]
+    ids = array("q"); ids.frombytes(data[pos:pos+n_ids]); pos += n_ids
+    clues = data[pos:pos+n_clues].decode("utf-8").split(_SEP) if header["count"] else []; pos += n_clues
+    answers = data[pos:pos+n_answers].decode("utf-8").split(_SEP) if header["count"] else []
+    return Question.from_normalized(ids, clues, answers)
+
+def load_question_bank(path, use_cache=True):
+    """Questions from path, through the compiled cache when it is still valid."""
+    if not use_cache:
+        return load_questions(path)
+    cache_path = path + CACHE_SUFFIX
+    st = os.stat(path)
+    source_hash = None
+    try:
+        header = read_compiled_header(cache_path) if os.path.exists(cache_path) else None
+        if header is not None:
+            if header["size"] == st.st_size and header["mtime_ns"] == st.st_mtime_ns:
+                return read_compiled(cache_path)
+            # touched or copied but identical content: still valid, just refresh the stamp
+            source_hash = _file_hash(path)
+            if header["hash"] == source_hash:
+                questions = read_compiled(cache_path)
+                write_compiled(cache_path, questions, st, source_hash)
+                return questions
+    except Exception:
+        traceback.print_exc()
+    questions = load_questions(path)
+    try:
+        write_compiled(cache_path, questions, st, source_hash or _file_hash(path))
+    except OSError:
+        traceback.print_exc()  # read-only install directory: work uncached
+    return questions
@@ -0,0 +1,181 @@
+# sampler.py
+# CROSSWORD PUZZLE — weighted question sampling (no Qt, no pandas).
+# A Fenwick tree over per-question weights gives O(log n) draws and O(log n) weight updates,
+# so picking 7 questions from a million-entry bank never copies or scans the bank.
+
+import random
+import threading
+from array import array
+
+from crossword_gen import question_key
+
+# a question missed on every letter is drawn (1 + ADAPTIVE_BOOST) times as often as an unseen one
+ADAPTIVE_BOOST = 3.0
+# how many drawn questions stay recordable; covers the prefetch queue and the puzzle on screen
+RECENT_DRAWS = 1024
+# excluded draws allowed per requested question before the pool is scanned for unexcluded ones
+EXCLUDE_REDRAWS = 50
+
+class FenwickTree:
+    """Prefix sums over n non-negative weights."""
+    def __init__(self, weights):
+        n = len(weights)
+        self.n = n
+        self.weights = array("d", weights)
+        self.top = 1 << (n.bit_length() - 1) if n else 0
+        self.rebuild()
+
+    def rebuild(self):
+        # O(n) build: every node passes its partial sum on to its parent once
+        n = self.n
+        tree = array("d", [0.0]) * (n + 1)
+        for i, w in enumerate(self.weights, start=1):
+            tree[i] += w
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self.tree = tree
+        self.positive = sum(1 for w in self.weights if w > 0)
+        # set() adds and subtracts floats, so the sums drift; rebuilding after n updates keeps
+        # the drift bounded at O(1) amortized per update
+        self.updates = 0
+
+    def total(self):
+        # exactly 0 once no weight is positive, whatever the drifted sums say
+        return self.prefix(self.n) if self.positive else 0.0
+
+    def prefix(self, i):
+        # sum of weights[0:i]
+        s = 0.0; tree = self.tree
+        while i > 0:
+            s += tree[i]; i -= i & -i
+        return s
+
+    def set(self, i, weight):
+        old = self.weights[i]
+        self.positive += (weight > 0) - (old > 0)
+        self.weights[i] = weight
+        self.updates += 1
+        if self.updates > self.n:
+            self.rebuild()
+            return
+        delta = weight - old
+        i += 1; tree = self.tree; n = self.n
+        while i <= n:
+            tree[i] += delta; i += i & -i
+
+    def find(self, x):
+        """Smallest index whose running sum exceeds x (0 <= x < total)."""
+        pos = 0; step = self.top; tree = self.tree; n = self.n; weights = self.weights
+        while step:
+            nxt = pos + step
+            if nxt <= n and tree[nxt] <= x:
+                pos = nxt; x -= tree[nxt]
+            step >>= 1
+        if pos < n and weights[pos] > 0:
+            return pos
+        # float drift can land past the last positive weight or on a zero one: take the nearest
+        # positive weight before it, else after it
+        j = min(pos, n - 1)
+        while j >= 0 and weights[j] <= 0:
+            j -= 1
+        if j < 0:
+            j = pos
+            while j < n and weights[j] <= 0:
+                j += 1
+            if j >= n:
+                raise ValueError("no positive weight to draw from")
+        return j
+
+class AdaptiveSampler:
+    """Draws questions from a pool with weights that follow how often students miss them."""
+    def __init__(self, questions, boost=ADAPTIVE_BOOST):
+        self.questions = questions
+        self.boost = boost
+        self.tree = FenwickTree([1.0] * len(questions))
+        # question -> position for recent draws, so record() needs no index over the whole pool
+        self.recent = {}
+        self.letters = array("I", [0]) * len(questions)
+        self.wrong = array("I", [0]) * len(questions)
+        # question_key() per position, hashed on the first full-pool scan for unexcluded questions
+        self.keys = None
+        # the prefetch thread draws while the GUI thread records results
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.questions)
+
+    def sample_positions(self, k, rng=None, exclude=None):
+        """k distinct pool positions, each draw weighted by the current weights.
+
+        Questions whose question_key() is in exclude (e.g. a seen_store.SeenSet) are redrawn; the cost
+        grows with the number of draws, not the pool. When excluded questions keep coming up
+        (about everything has been seen) the pool is scanned once for the rest, and only if
+        fewer than k are left are the remaining picks allowed to repeat."""
+        rng = rng or random
+        budget = k * EXCLUDE_REDRAWS
+        with self.lock:
+            tree = self.tree
+            drawn = []; rejected = []
+            try:
+                while len(drawn) < k:
+                    total = tree.total()
+                    if total <= 0:
+                        if not rejected:
+                            break
+                        # only excluded questions are left: put them back in the running
+                        exclude = None
+                        for i, w in rejected:
+                            tree.set(i, w)
+                        rejected = []
+                        continue
+                    i = tree.find(rng.random() * total)
+                    w = tree.weights[i]
+                    tree.set(i, 0.0)  # without replacement: out of the running until restored
+                    if exclude is not None and question_key(self.questions[i]) in exclude:
+                        rejected.append((i, w))
+                        if len(rejected) >= budget:
+                            drawn += self._draw_unexcluded(k - len(drawn), rng, exclude)
+                            exclude = None
+                        continue
+                    drawn.append((i, w))
+            finally:
+                for i, w in drawn + rejected:
+                    tree.set(i, w)
+        if len(drawn) < k:
+            raise ValueError(f"cannot draw {k} questions, only {len(drawn)} have a non-zero weight")
+        return [i for i, _ in drawn]
+
+    def _draw_unexcluded(self, k, rng, exclude):
+        # redraws keep hitting excluded questions: scan the pool once for the few that are left,
+        # so repeats are only allowed when there really are fewer than k of them
+        tree = self.tree
+        if self.keys is None:
+            self.keys = array("Q", map(question_key, self.questions))
+        rest = [i for i, key in enumerate(self.keys) if tree.weights[i] > 0 and key not in exclude]
+        drawn = []
+        while rest and len(drawn) < k:
+            j = rng.choices(range(len(rest)), [tree.weights[i] for i in rest])[0]
+            i = rest.pop(j)
+            drawn.append((i, tree.weights[i]))
+            tree.set(i, 0.0)
+        return drawn
+
+    def sample(self, k, rng=None, exclude=None):
+        positions = self.sample_positions(k, rng, exclude)
+        picked = [self.questions[i] for i in positions]
+        with self.lock:
+            for i, q in zip(positions, picked):
+                self.recent[q] = i
+            while len(self.recent) > RECENT_DRAWS:
+                del self.recent[next(iter(self.recent))]
+        return picked
+
+    def record(self, question, wrong, letters):
+        """Fold one answered word (wrong letters out of letters) into that question's weight."""
+        with self.lock:
+            i = self.recent.get(question)
+            if i is None or letters <= 0:
+                return
+            self.wrong[i] += wrong; self.letters[i] += letters
+            self.tree.set(i, 1.0 + self.boost * self.wrong[i] / self.letters[i])
@@ -0,0 +1,162 @@
+# seen_store.py
+# CROSSWORD PUZZLE — which questions each student has already been given.
+# One compressed SeenSet of question keys (crossword_gen.question_key: a hash of answer and clue,
+# not the bank's ids, which can be row numbers) per (name, class, section), kept in SQLite next to
+# the layout cache so every station sharing the install directory sees the same history.
+
+import sqlite3
+import struct
+import sys
+import time
+import traceback
+import zlib
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+
+SEEN_STORE_FILE = "seen_questions.sqlite"
+
+def student_key(name, clas, section):
+    return "|".join(str(x or "").strip().lower() for x in (name, clas, section))
+
+# ids are split roaring-style: the high bits pick a chunk of 65536 ids, which is a sorted array of
+# the low 16 bits while sparse and an 8 KB bitmap once it holds more than SPARSE_LIMIT ids
+CHUNK_BITS = 16
+SPARSE_LIMIT = 4096
+MAX_ID = (1 << 64) - 1
+_BLOB_MAGIC = b"SEEN2"
+_CHUNK_HEADER = struct.Struct("<QBI")  # chunk key, dense flag, id count
+
+class SeenSet:
+    """Set of non-negative integers below 2**64 (question keys); memory follows the number stored, not their size."""
+    __slots__ = ("chunks",)
+    def __init__(self, chunks=None):
+        self.chunks = chunks if chunks is not None else {}
+
+    def __contains__(self, qid):
+        if not isinstance(qid, int) or not 0 <= qid <= MAX_ID:
+            return False
+        chunk = self.chunks.get(qid >> CHUNK_BITS)
+        if chunk is None:
+            return False
+        low = qid & 0xFFFF
+        if isinstance(chunk, bytearray):
+            return bool(chunk[low >> 3] >> (low & 7) & 1)
+        i = bisect_left(chunk, low)
+        return i < len(chunk) and chunk[i] == low
+
+    def add(self, qid):
+        if not isinstance(qid, int) or not 0 <= qid <= MAX_ID:
+            return
+        key = qid >> CHUNK_BITS; low = qid & 0xFFFF
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            self.chunks[key] = array("H", [low])
+        elif isinstance(chunk, bytearray):
+            chunk[low >> 3] |= 1 << (low & 7)
+        else:
+            i = bisect_left(chunk, low)
+            if i < len(chunk) and chunk[i] == low:
+                return
+            chunk.insert(i, low)
+            if len(chunk) > SPARSE_LIMIT:
+                bits = bytearray(1 << (CHUNK_BITS - 3))
+                for v in chunk:
+                    bits[v >> 3] |= 1 << (v & 7)
+                self.chunks[key] = bits
+
+    def update(self, qids):
+        for qid in qids:
+            self.add(qid)
+
+    def __len__(self):
+        return sum(int.from_bytes(c, "little").bit_count() if isinstance(c, bytearray) else len(c)
+                   for c in self.chunks.values())
+
+    def to_blob(self):
+        parts = [_BLOB_MAGIC]
+        for key in sorted(self.chunks):
+            chunk = self.chunks[key]
+            dense = isinstance(chunk, bytearray)
+            parts.append(_CHUNK_HEADER.pack(key, dense, 0 if dense else len(chunk)))
+            if dense:
+                parts.append(bytes(chunk))
+            else:
+                if sys.byteorder != "little":
+                    chunk = array("H", chunk); chunk.byteswap()
+                parts.append(chunk.tobytes())
+        return zlib.compress(b"".join(parts), 6)
+
+    @classmethod
+    def from_blob(cls, blob):
+        data = zlib.decompress(blob)
+        if not data.startswith(_BLOB_MAGIC):
+            # a flat bitmap over ids, as first stored
+            seen = cls()
+            for byte, bits in enumerate(data):
+                if not bits:
+                    continue
+                for b in range(8):
+                    if bits >> b & 1:
+                        seen.add(byte * 8 + b)
+            return seen
+        chunks = {}; pos = len(_BLOB_MAGIC)
+        while pos < len(data):
+            key, dense, count = _CHUNK_HEADER.unpack_from(data, pos); pos += _CHUNK_HEADER.size
+            if dense:
+                size = 1 << (CHUNK_BITS - 3)
+                chunks[key] = bytearray(data[pos:pos + size])
+            else:
+                size = 2 * count
+                chunk = array("H"); chunk.frombytes(data[pos:pos + size])
+                if sys.byteorder != "little":
+                    chunk.byteswap()
+                chunks[key] = chunk
+            pos += size
+        return cls(chunks)
+
+class SeenStore:
+    """Per-student SeenSets in SQLite; a failed read just means nothing is excluded."""
+    def __init__(self, path=SEEN_STORE_FILE):
+        self.path = path
+        try:
+            with self._connect() as con:
+                # histories by question key; the old "seen" table held bank ids, which cannot be
+                # mapped back to questions reliably, so it is left unread
+                con.execute("CREATE TABLE IF NOT EXISTS seen_keys (student TEXT PRIMARY KEY, bitmap BLOB, updated REAL)")
+        except Exception:
+            traceback.print_exc()
+
+    @contextmanager
+    def _connect(self):
+        # short-lived connections and the rollback journal, as in layout_cache
+        con = sqlite3.connect(self.path, timeout=10)
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    def get(self, name, clas, section):
+        try:
+            with self._connect() as con:
+                row = con.execute("SELECT bitmap FROM seen_keys WHERE student = ?", (student_key(name, clas, section),)).fetchone()
+        except Exception:
+            traceback.print_exc()
+            return SeenSet()
+        return SeenSet.from_blob(row[0]) if row else SeenSet()
+
+    def mark(self, name, clas, section, keys):
+        """Add question keys to the student's stored history."""
+        key = student_key(name, clas, section)
+        try:
+            with self._connect() as con:
+                # merge inside the write transaction so two stations cannot drop each other's keys
+                con.execute("BEGIN IMMEDIATE")
+                row = con.execute("SELECT bitmap FROM seen_keys WHERE student = ?", (key,)).fetchone()
+                seen = SeenSet.from_blob(row[0]) if row else SeenSet()
+                seen.update(keys)
+                con.execute("INSERT OR REPLACE INTO seen_keys (student, bitmap, updated) VALUES (?, ?, ?)",
+                            (key, seen.to_blob(), time.time()))
+        except Exception:
+            traceback.print_exc()
@@ -0,0 +1,52 @@
+# startup.py
+# CROSSWORD PUZZLE — startup timing (imported first by v21.py, no Qt, no pandas).
+# Timing is off by default; turn it on with
+#   python v21.py --startup-timing        or        CROSSWORD_STARTUP_TIMING=1 python v21.py
+# Each mark is printed with its time since launch, like -X importtime but for whole startup
+# steps, and the run is appended to STARTUP_LOG_FILE so slow kiosks can be compared later.
+
+import json
+import os
+import sys
+import threading
+import time
+
+T0 = time.perf_counter()
+ENABLED = "--startup-timing" in sys.argv or bool(os.environ.get("CROSSWORD_STARTUP_TIMING"))
+STARTUP_LOG_FILE = "startup_timing.jsonl"
+
+_marks = []
+_reported = False
+_lock = threading.Lock()
+
+def mark(label):
+    """Record that a startup step finished (cheap no-op unless timing is enabled)."""
+    if not ENABLED:
+        return
+    ms = (time.perf_counter() - T0) * 1000
+    with _lock:
+        prev = _marks[-1][1] if _marks else 0.0
+        _marks.append((label, ms))
+        late = _reported
+    if late:
+        # steps that finish after the report (background imports) are printed as they happen
+        print(f"[startup] {ms:8.1f} ms  +{ms - prev:7.1f}  {label}", file=sys.stderr)
+
+def report(label="first dialog shown"):
+    """Mark label, print the timeline so far and append it to STARTUP_LOG_FILE."""
+    global _reported
+    if not ENABLED or _reported:
+        return
+    mark(label)
+    with _lock:
+        marks = list(_marks); _reported = True
+    prev = 0.0
+    for name, ms in marks:
+        print(f"[startup] {ms:8.1f} ms  +{ms - prev:7.1f}  {name}", file=sys.stderr)
+        prev = ms
+    print(f"[startup] time to {label}: {marks[-1][1]:.1f} ms", file=sys.stderr)
+    try:
+        with open(STARTUP_LOG_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"time": time.time(), "marks": [[n, round(ms, 1)] for n, ms in marks]}) + "\n")
+    except OSError:
+        pass
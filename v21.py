@@ -1,53 +1,42 @@
 # v21.py
 # CROSSWORD PUZZLE — v21
-# Save as V21.py and run. Requires PyQt6, pandas, openpyxl, pillow.
+# Save as V21.py and run. Requires PyQt6, openpyxl, pillow.
 #the necessary modules you need to run this code are
-#py -3.14 -m pip install PyQt6 PyQt6-Qt6 PyQt6-sip pandas openpyxl pillow
+#py -3.14 -m pip install PyQt6 PyQt6-Qt6 PyQt6-sip openpyxl pillow
 
+import startup  # first, so startup timing covers every import below
 import sys
 import os
 import json
-import random
+import queue
 import time
 import traceback
 import uuid
 from datetime import datetime
 
 from PyQt6 import QtCore, QtGui, QtWidgets
-import pandas as pd
+startup.mark("PyQt6 imported")
+
+from crossword_gen import (
+    GRID_SIZE, WORDS_TO_PICK, DUMMY_QUESTIONS, create_crossword_for_student, PARALLEL_WORKERS, question_key,
+)
+from layout_cache import LayoutCache, LAYOUT_CACHE_FILE
+from question_bank import load_question_bank
+from word_index import PatternIndex
+from sampler import AdaptiveSampler
+from seen_store import SeenStore, SEEN_STORE_FILE, student_key
+from puzzle_state import PuzzleState
+from compiled_puzzle import compile_puzzle
+from leaderboard_store import open_leaderboard, LEADERBOARD_DB_FILE
+startup.mark("puzzle modules imported")
 
 APP_TITLE = "CROSSWORD PUZZLE — V21"
 CONFIG_FILE = "config.json"
-LEADERBOARD_FILE = "leaderboard.csv"
-GRID_SIZE = 16
-WORDS_TO_PICK = 7
+LEADERBOARD_FILE = "leaderboard.csv"  # the CSV leaderboard, and what the sqlite store imports once
+LEADERBOARD_BACKEND = "sqlite"
+QUESTION_BANK_FILE = "questions.xlsx"
 ADMIN_PASSWORD = "0"
-
-# small sample pool — replace with your real dataset if needed
-DUMMY_QUESTIONS = [
-    {"id": 1, "clue": "Capital of France", "answer": "PARIS"},
-    {"id": 2, "clue": "Largest planet", "answer": "JUPITER"},
-    {"id": 3, "clue": "Opposite of hot", "answer": "COLD"},
-    {"id": 4, "clue": "Feline pet", "answer": "CAT"},
-    {"id": 5, "clue": "Sound unit", "answer": "DECIBEL"},
-    {"id": 6, "clue": "A small stream", "answer": "BROOK"},
-    {"id": 7, "clue": "Not heavy", "answer": "LIGHT"},
-    {"id": 8, "clue": "To freeze water", "answer": "ICE"},
-    {"id": 9, "clue": "Used for cutting", "answer": "SCISSORS"},
-    {"id": 10, "clue": "Opposite of night", "answer": "DAY"},
-    {"id": 11, "clue": "A flying mammal", "answer": "BAT"},
-    {"id": 12, "clue": "Computer brain", "answer": "CPU"},
-    {"id": 13, "clue": "Unit of memory", "answer": "BYTE"},
-    {"id": 14, "clue": "Ocean animal with eight arms", "answer": "OCTOPUS"},
-    {"id": 15, "clue": "Yellow fruit", "answer": "BANANA"},
-    {"id": 16, "clue": "Precious metal", "answer": "GOLD"},
-    {"id": 17, "clue": "Time of day [abbr]", "answer": "AM"},
-    {"id": 18, "clue": "A fast animal", "answer": "CHEETAH"},
-    {"id": 19, "clue": "Bird that cannot fly", "answer": "EMU"},
-    {"id": 20, "clue": "Opposite of left", "answer": "RIGHT"},
-]
-
-SCORE_BY_WRONG = {0: 25, 1: 18, 2: 15, 3: 12, 4: 10, 5: 8, 6: 6, 7: 4, 8: 2}
+PREFETCH_SIZE = 3
 
 FEEDBACK_WORDS = {
     range(1, 3): "Very Poor",
@@ -68,7 +57,7 @@ def ensure_config():
     if not os.path.exists(CONFIG_FILE):
         try:
             with open(CONFIG_FILE, "w") as f:
-                json.dump({"admin_password": ADMIN_PASSWORD, "leaderboard_file": LEADERBOARD_FILE}, f)
+                json.dump({"admin_password": ADMIN_PASSWORD, "leaderboard_file": LEADERBOARD_FILE, "leaderboard_backend": LEADERBOARD_BACKEND}, f)
         except Exception:
             traceback.print_exc()
 
@@ -80,238 +69,334 @@ def load_config():
     except Exception:
         return {"admin_password": ADMIN_PASSWORD, "leaderboard_file": LEADERBOARD_FILE}
 
-def load_leaderboard():
-    # Ensure file exists with required columns
-    required = ["EntryID", "Name", "Class", "Section", "Score", "TimeSeconds", "Rating", "FeedbackWord", "Heart"]
-    if not os.path.exists(LEADERBOARD_FILE):
-        df = pd.DataFrame(columns=required)
+def load_question_pool(cfg):
+    # a bank file (config "question_bank_file", default questions.xlsx) if present, else the built-in questions
+    path = cfg.get("question_bank_file") or QUESTION_BANK_FILE
+    if os.path.exists(path):
         try:
-            df.to_csv(LEADERBOARD_FILE, index=False)
+            questions = load_question_bank(path)
+            if len(questions) >= WORDS_TO_PICK:
+                return questions
+            print(f"{path}: only {len(questions)} usable questions, using built-in questions")
         except Exception:
             traceback.print_exc()
-        return df
-    try:
-        df = pd.read_csv(LEADERBOARD_FILE)
-        for col in required:
-            if col not in df.columns:
-                df[col] = ""
-        return df
-    except Exception:
-        traceback.print_exc()
-        # return a safe empty dataframe with required columns
-        return pd.DataFrame(columns=required)
+    return DUMMY_QUESTIONS
 
-def save_leaderboard_df(df):
-    try:
-        # ensure df has required cols
-        required = ["EntryID", "Name", "Class", "Section", "Score", "TimeSeconds", "Rating", "FeedbackWord", "Heart"]
-        for c in required:
-            if c not in df.columns:
-                df[c] = ""
-        df.to_csv(LEADERBOARD_FILE, index=False)
-    except Exception:
-        traceback.print_exc()
+_LEADERBOARD = None
+
+def leaderboard():
+    # opened on first use; config "leaderboard_backend" picks the storage (see leaderboard_store.BACKENDS)
+    global _LEADERBOARD
+    if _LEADERBOARD is None:
+        cfg = load_config()
+        csv_path = cfg.get("leaderboard_file") or LEADERBOARD_FILE
+        try:
+            _LEADERBOARD = open_leaderboard(cfg.get("leaderboard_backend") or LEADERBOARD_BACKEND, LEADERBOARD_DB_FILE, csv_path=csv_path)
+        except Exception:
+            traceback.print_exc()
+            _LEADERBOARD = open_leaderboard(LEADERBOARD_BACKEND, LEADERBOARD_DB_FILE, csv_path=csv_path)
+    return _LEADERBOARD
 
 def append_leaderboard_entry(name, clas, section, score, time_seconds):
-    # defensively create an entry even if inputs are None or malformed
-    try:
-        df = load_leaderboard()
-        entry_id = str(uuid.uuid4())
-        safe_name = str(name) if name is not None else "Anonymous"
-        safe_class = str(clas) if clas is not None else ""
-        safe_section = str(section) if section is not None else ""
-        safe_score = int(score) if (isinstance(score, (int, float)) or (str(score).isdigit())) else 0
-        safe_time = int(time_seconds) if (isinstance(time_seconds, (int, float)) or (str(time_seconds).isdigit())) else 0
-        new = pd.DataFrame([{
-            "EntryID": entry_id,
-            "Name": safe_name, "Class": safe_class, "Section": safe_section,
-            "Score": safe_score, "TimeSeconds": safe_time,
-            "Rating": "", "FeedbackWord": "", "Heart": ""
-        }])
-        df = pd.concat([df, new], ignore_index=True)
-        df = df.sort_values(by=["Score", "Name"], ascending=[False, True]).reset_index(drop=True)
-        save_leaderboard_df(df)
-        return df, entry_id
-    except Exception:
-        traceback.print_exc()
-        # return an empty df and a generated id to avoid crash
-        return load_leaderboard(), str(uuid.uuid4())
+    # defensively create an entry even if inputs are None or malformed; returns the new EntryID
+    safe_name = str(name) if name is not None else "Anonymous"
+    safe_class = str(clas) if clas is not None else ""
+    safe_section = str(section) if section is not None else ""
+    safe_score = int(score) if (isinstance(score, (int, float)) or (str(score).isdigit())) else 0
+    safe_time = int(time_seconds) if (isinstance(time_seconds, (int, float)) or (str(time_seconds).isdigit())) else 0
+    return leaderboard().add({"EntryID": str(uuid.uuid4()), "Name": safe_name, "Class": safe_class, "Section": safe_section,
+                              "Score": safe_score, "TimeSeconds": safe_time})
 
 def update_leaderboard_by_entryid(entry_id, rating=None, feedback_word=None, heart=None):
     try:
-        df = load_leaderboard()
-        if df.empty:
-            return False
-        # robust lookup: cast to str and compare
-        if "EntryID" in df.columns:
-            idxs = df.index[df["EntryID"].astype(str) == str(entry_id)].tolist()
-        else:
-            idxs = []
-        if not idxs:
-            # fallback: try to find last row if entry id missing
-            idxs = [len(df)-1] if len(df) > 0 else []
-        changed = False
-        for idx in idxs:
-            if rating is not None:
-                df.at[idx, "Rating"] = rating; changed = True
-            if feedback_word is not None:
-                df.at[idx, "FeedbackWord"] = feedback_word; changed = True
-            if heart is not None:
-                df.at[idx, "Heart"] = heart; changed = True
-        if changed:
-            df = df.sort_values(by=["Score", "Name"], ascending=[False, True]).reset_index(drop=True)
-            save_leaderboard_df(df)
-        return changed
+        fields = {k: v for k, v in (("Rating", rating), ("FeedbackWord", feedback_word), ("Heart", heart)) if v is not None}
+        return bool(entry_id) and bool(fields) and leaderboard().update(entry_id, **fields)
     except Exception:
         traceback.print_exc()
         return False
 
-# --- crossword generation ---
-class Placement:
-    def __init__(self, word, clue, r, c, dr, dc):
-        self.word = word; self.clue = clue; self.r = r; self.c = c; self.dr = dr; self.dc = dc
-
-def empty_grid(n=GRID_SIZE):
-    return [[" " for _ in range(n)] for __ in range(n)]
-
-def fits(grid, word, r, c, dr, dc):
-    n = len(grid)
-    end_r = r + dr*(len(word)-1)
-    end_c = c + dc*(len(word)-1)
-    if not (0 <= r < n and 0 <= c < n and 0 <= end_r < n and 0 <= end_c < n):
-        return False
-    for i, ch in enumerate(word):
-        rr = r + dr*i; cc = c + dc*i
-        existing = grid[rr][cc]
-        if existing != " " and existing != ch:
-            return False
-        if existing == " ":
-            perp_dr, perp_dc = dc, dr
-            for offset in (-1, 1):
-                rr2 = rr + perp_dr*offset; cc2 = c + perp_dc*offset
-                if 0 <= rr2 < n and 0 <= cc2 < n and grid[rr2][cc2] != " ":
-                    return False
-    before_r = r - dr; before_c = c - dc
-    if 0 <= before_r < n and 0 <= before_c < n and grid[before_r][before_c] != " ":
-        return False
-    after_r = end_r + dr; after_c = end_c + dc
-    if 0 <= after_r < n and 0 <= after_c < n and grid[after_r][after_c] != " ":
-        return False
-    return True
-
-def place_word_on_grid(grid, word, r, c, dr, dc):
-    for i, ch in enumerate(word):
-        grid[r+dr*i][c+dc*i] = ch
-
-def try_generate_grid_for_words(words):
-    n = GRID_SIZE
-    words_sorted = sorted(words, key=lambda w: -len(w["answer"]))
-    orientations = [(0, 1), (1, 0)]
-    for attempt in range(200):
-        grid = empty_grid(n)
-        placements = []
-        first = words_sorted[0]["answer"]
-        placed_first = False
-        for _ in range(200):
-            dr, dc = random.choice(orientations)
-            r = random.randint(0, n-1); c = random.randint(0, n-1)
-            if fits(grid, first, r, c, dr, dc):
-                place_word_on_grid(grid, first, r, c, dr, dc)
-                placements.append(Placement(first, words_sorted[0]["clue"], r, c, dr, dc))
-                placed_first = True; break
-        if not placed_first:
-            continue
-        ok = True
-        for wobj in words_sorted[1:]:
-            word = wobj["answer"]
-            placed_this = False
-            letter_positions = [(r0, c0, grid[r0][c0]) for r0 in range(n) for c0 in range(n) if grid[r0][c0] != " "]
-            random.shuffle(letter_positions)
-            for r0, c0, ch in letter_positions:
-                for idx, ch2 in enumerate(word):
-                    if ch2 != ch: continue
-                    for dr, dc in orientations:
-                        start_r = r0 - dr*idx; start_c = c0 - dc*idx
-                        if fits(grid, word, start_r, start_c, dr, dc):
-                            place_word_on_grid(grid, word, start_r, start_c, dr, dc)
-                            placements.append(Placement(word, wobj["clue"], start_r, start_c, dr, dc))
-                            placed_this = True; break
-                    if placed_this: break
-                if placed_this: break
-            if placed_this: continue
-            all_positions = []
-            for rr in range(n):
-                for cc in range(n):
-                    for dr, dc in orientations:
-                        if fits(grid, word, rr, cc, dr, dc):
-                            all_positions.append((rr, cc, dr, dc))
-            if all_positions:
-                rpos, cpos, drpos, dcpos = random.choice(all_positions)
-                place_word_on_grid(grid, word, rpos, cpos, drpos, dcpos)
-                placements.append(Placement(word, wobj["clue"], rpos, cpos, drpos, dcpos))
-            else:
-                ok = False; break
-        if ok:
-            return grid, placements
-    return None, None
-
-def create_crossword_for_student(question_pool, pick_count=WORDS_TO_PICK):
-    pool = question_pool.copy()
-    if len(pool) < pick_count:
-        pool = DUMMY_QUESTIONS.copy()
-    pick = random.sample(pool, k=pick_count)
-    for p in pick:
-        p["answer"] = p["answer"].upper().replace(" ", "")
-    grid, placements = try_generate_grid_for_words(pick)
-    if grid is None:
-        for _ in range(5):
-            grid, placements = try_generate_grid_for_words(pick)
-            if grid is not None:
-                break
-    return pick, grid, placements
-
 # --- GUI widgets ---
-class CellWidget(QtWidgets.QLineEdit):
-    clicked = QtCore.pyqtSignal(int, int)
-    def __init__(self, r, c, parent=None):
+ARROW_STEPS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+class BoardModel:
+    """What the grid shows: check marks, locks and clue numbers over a PuzzleState (solution and letters)."""
+    def __init__(self, n=GRID_SIZE):
+        self.n = n
+        self.load(None)
+
+    def load(self, puzzle=None):
+        """Show a CompiledPuzzle (None: an empty board); the word lookups come from the puzzle."""
+        n = self.n
+        self.puzzle = puzzle
+        self.state = PuzzleState(puzzle.grid if puzzle else [" "*n]*n, puzzle.placed() if puzzle else ())
+        self.marks = [[None]*n for _ in range(n)]  # None, "correct" or "incorrect"
+        self.locked = [[False]*n for _ in range(n)]
+        self.numbers = puzzle.numbers if puzzle else {}  # (r, c) -> clue number
+        self.words = [e.cells() for e in puzzle.entries] if puzzle else []  # word id -> its cells
+        self.clue_words = puzzle.by_clue if puzzle else {}  # (number, "across"/"down") -> word id
+        # direction -> {cell: (word id, index in word)}
+        self.word_at = puzzle.cell_entries if puzzle else {(0, 1): {}, (1, 0): {}}
+        self.step = self.arrow_steps()  # arrow direction -> {cell: next letter cell}
+
+    def is_block(self, r, c):
+        return self.state.is_block(r, c)
+
+    def is_open(self, r, c):
+        # a cell the player can move to and type in
+        return 0 <= r < self.n and 0 <= c < self.n and not self.is_block(r, c) and not self.locked[r][c]
+
+    def arrow_steps(self):
+        # arrow targets: walk each row/column backwards remembering the last letter cell seen
+        n = self.n; steps = {}
+        for dr, dc in ARROW_STEPS:
+            table = steps[(dr, dc)] = {}
+            for line in range(n):
+                target = None
+                for k in range(n):
+                    k = n - 1 - k if dr + dc > 0 else k
+                    cell = (k, line) if dr else (line, k)
+                    if not self.is_block(*cell):
+                        if target is not None:
+                            table[cell] = target
+                        target = cell
+        return steps
+
+    def word_through(self, r, c, direction):
+        # (cells, index of (r, c)) of the word through (r, c) in direction, or ((), None)
+        hit = self.word_at[direction].get((r, c))
+        return (self.words[hit[0]], hit[1]) if hit else ((), None)
+
+    def mark(self, r, c, state, lock=True):
+        self.marks[r][c] = state
+        if lock:
+            self.locked[r][c] = True
+
+class CrosswordGrid(QtWidgets.QWidget):
+    """The whole puzzle as one painted widget over a BoardModel.
+
+    Owns the selection (active cell, direction, active word) and handles typing,
+    arrows and backspace itself; the window only listens to the two signals."""
+    cellSelected = QtCore.pyqtSignal(int, int)
+    letterEntered = QtCore.pyqtSignal(int, int)
+
+    GAP = 2; MARGIN = 8
+    ARROWS = {QtCore.Qt.Key.Key_Right: (0, 1), QtCore.Qt.Key.Key_Left: (0, -1),
+              QtCore.Qt.Key.Key_Down: (1, 0), QtCore.Qt.Key.Key_Up: (-1, 0)}
+
+    def __init__(self, board, parent=None):
         super().__init__(parent)
-        self.r = r; self.c = c
-        self.setMaxLength(1)
-        self.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.setFont(QtGui.QFont("Consolas", 12))
-        self.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.NoContextMenu)
-        self.setFixedSize(36, 36)
-        self.correct_letter = None
-        self.is_block = False
-        self.locked = False
-        self.setStyleSheet("background-color: white; color: black; border: 1px solid #ddd;")
+        self.board = board
+        self.active = None; self.direction = None; self.word = []
+        self.setFocusPolicy(QtCore.Qt.FocusPolicy.StrongFocus)
+        self.setSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+
+    def reset(self):
+        self.active = None; self.direction = None; self.word = []
+        self.update()
+
+    def update_cells(self, cells):
+        # repaint just these cells; Qt merges the rects into one paint event
+        region = QtGui.QRegion()
+        for r, c in cells:
+            region += self.cell_rect(r, c).adjusted(-1, -1, 1, 1)  # the 2px border spills into the gap
+        if not region.isEmpty():
+            self.update(region)
+
+    def sizeHint(self):
+        side = 2*self.MARGIN + min(self.board.n, 16) * 39
+        return QtCore.QSize(side, side)
+
+    def minimumSizeHint(self):
+        side = 2*self.MARGIN + self.board.n * 14
+        return QtCore.QSize(side, side)
+
+    # --- geometry ---
+    def cell_size(self):
+        n = self.board.n
+        return max(8, min(self.width() - 2*self.MARGIN, self.height() - 2*self.MARGIN) // n)
+
+    def origin(self):
+        side = self.cell_size() * self.board.n
+        return (self.width() - side) // 2, (self.height() - side) // 2
+
+    def cell_rect(self, r, c):
+        s = self.cell_size(); x0, y0 = self.origin()
+        return QtCore.QRect(x0 + c*s, y0 + r*s, s - self.GAP, s - self.GAP)
+
+    def cell_at(self, pos):
+        s = self.cell_size(); x0, y0 = self.origin()
+        r = (pos.y() - y0) // s; c = (pos.x() - x0) // s
+        if 0 <= r < self.board.n and 0 <= c < self.board.n:
+            return r, c
+        return None
+
+    # --- selection ---
+    def select(self, r, c, direction=None):
+        """Make (r, c) the active cell and pick the word through it (keeping the direction when possible)."""
+        board = self.board; old_word = self.word
+        ac = board.word_through(r, c, (0, 1))[0]; dn = board.word_through(r, c, (1, 0))[0]
+        cd = direction or self.direction
+        if cd == (0, 1) and len(ac) > 1:
+            self.word = ac; self.direction = (0, 1)
+        elif cd == (1, 0) and len(dn) > 1:
+            self.word = dn; self.direction = (1, 0)
+        elif len(ac) >= len(dn) and len(ac) > 1:
+            self.word = ac; self.direction = (0, 1)
+        elif len(dn) > 1:
+            self.word = dn; self.direction = (1, 0)
+        else:
+            self.word = ac or dn or ((r, c),)
+            self.direction = (0, 1) if ac or not dn else (1, 0)
+        # only cells whose highlight changed are repainted: the two words' difference plus both active cells
+        changed = set(old_word).symmetric_difference(self.word)
+        changed.update(x for x in (self.active, (r, c)) if x is not None)
+        self.active = (r, c)
+        self.update_cells(changed)
+        self.cellSelected.emit(r, c)
+
+    def move_to(self, r, c):
+        if self.board.is_open(r, c):
+            self.select(r, c)
+            return True
+        return False
 
+    # --- events ---
     def mousePressEvent(self, ev):
-        super().mousePressEvent(ev)
-        self.clicked.emit(self.r, self.c)
-
-    def set_block(self):
-        self.is_block = True
-        self.setDisabled(True)
-        self.setStyleSheet("background-color: #4a4a4a; border: 1px solid #333; color: white;")
-
-    def set_locked(self):
-        self.locked = True
-        self.setReadOnly(True)
-        self.setDisabled(True)
-
-    def set_answer(self, ch):
-        self.correct_letter = ch
-
-    def clear_visuals(self):
-        if not self.is_block:
-            self.setStyleSheet("background-color: white; color: black; border: 1px solid #ddd;")
-
-    def mark_correct(self):
-        self.setStyleSheet("background-color: #b6e7b6; border: 1px solid #2e8b57; color: black;")
-
-    def mark_incorrect(self):
-        self.setStyleSheet("background-color: #f7c6c6; border: 1px solid #a52a2a; color: black;")
+        cell = self.cell_at(ev.position().toPoint())
+        if cell is not None and self.board.is_open(*cell):
+            self.setFocus()
+            self.select(*cell)
+
+    def keyPressEvent(self, ev):
+        if self.active is None:
+            return super().keyPressEvent(ev)
+        board = self.board; r, c = self.active; key = ev.key()
+        if key in self.ARROWS:
+            # next letter cell that way, jumping over blocks and locked (checked) cells
+            step = board.step[self.ARROWS[key]]; target = step.get((r, c))
+            while target is not None and not board.is_open(*target):
+                target = step.get(target)
+            if target is not None:
+                self.select(*target)
+        elif key == QtCore.Qt.Key.Key_Backspace:
+            if board.state.get(r, c) and not board.locked[r][c]:
+                board.state.set(r, c, ""); self.update_cells([(r, c)])
+            elif self.direction is not None:
+                cells, i = board.word_through(r, c, self.direction)
+                if i:
+                    self.move_to(*cells[i - 1])
+        elif key == QtCore.Qt.Key.Key_Delete:
+            if not board.locked[r][c]:
+                board.state.set(r, c, ""); self.update_cells([(r, c)])
+        elif len(ev.text()) == 1 and ev.text().isalpha():
+            if board.locked[r][c]:
+                return
+            board.state.set(r, c, ev.text().upper()[:1])
+            self.update_cells([(r, c)])
+            self.letterEntered.emit(r, c)
+            # auto-advance along the active word
+            cells, i = board.word_through(r, c, self.direction)
+            if i is not None and i + 1 < len(cells):
+                self.move_to(*cells[i + 1])
+        else:
+            super().keyPressEvent(ev)
+
+    def paintEvent(self, ev):
+        board = self.board; n = board.n; s = self.cell_size(); x0, y0 = self.origin()
+        p = QtGui.QPainter(self)
+        letter_font = QtGui.QFont("Consolas"); letter_font.setPixelSize(max(6, int(s * 0.5)))
+        bold_font = QtGui.QFont(letter_font); bold_font.setBold(True)
+        number_font = QtGui.QFont("Segoe UI"); number_font.setPixelSize(max(5, int(s * 0.26)))
+        word = set(self.word); enabled = self.isEnabled()
+        # only cells inside the exposed region are painted
+        clip = ev.rect(); region = ev.region()
+        r_lo = max(0, (clip.top() - y0) // s); r_hi = min(n - 1, (clip.bottom() - y0) // s)
+        c_lo = max(0, (clip.left() - x0) // s); c_hi = min(n - 1, (clip.right() - x0) // s)
+        for r in range(r_lo, r_hi + 1):
+            for c in range(c_lo, c_hi + 1):
+                rect = self.cell_rect(r, c)
+                if not region.intersects(rect.adjusted(-1, -1, 1, 1)):
+                    continue
+                if board.is_block(r, c):
+                    p.fillRect(rect, QtGui.QColor("#4a4a4a")); continue
+                mark = board.marks[r][c]; width = 1
+                if mark == "correct":
+                    bg, border = "#b6e7b6", "#2e8b57"
+                elif mark == "incorrect":
+                    bg, border = "#f7c6c6", "#a52a2a"
+                elif (r, c) == self.active:
+                    bg, border, width = "#ccccff", "#0056b3", 2
+                elif (r, c) in word:
+                    bg, border, width = "#e6e6ff", "#0056b3", 2
+                else:
+                    bg, border = "#ffffff", "#dddddd"
+                p.fillRect(rect, QtGui.QColor(bg))
+                p.setPen(QtGui.QPen(QtGui.QColor(border), width))
+                p.drawRect(rect.adjusted(0, 0, -1, -1))
+                num = board.numbers.get((r, c))
+                if num:
+                    p.setPen(QtGui.QColor("#555555")); p.setFont(number_font)
+                    p.drawText(rect.adjusted(2, 1, 0, 0), QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop, str(num))
+                ch = board.state.get(r, c)
+                if ch:
+                    p.setPen(QtGui.QColor("#000000" if enabled else "#777777"))
+                    p.setFont(bold_font if (r, c) == self.active else letter_font)
+                    p.drawText(rect, QtCore.Qt.AlignmentFlag.AlignCenter, ch)
+        p.end()
+
+class ClueTableModel(QtCore.QAbstractTableModel):
+    """The across or down clues of a CompiledPuzzle; the row of the active word is highlighted."""
+    HEADERS = ("Clue No.", "Clue", "Letters")
+
+    def __init__(self, direction, parent=None):
+        super().__init__(parent)
+        self.direction = direction
+        self.entries = []; self.ids = []; self.rows = {}  # row -> entry, row -> puzzle entry id, id -> row
+        self.active = None  # highlighted row
+
+    def set_puzzle(self, puzzle):
+        # one reset per puzzle instead of inserting rows and items one by one
+        self.beginResetModel()
+        hits = [(eid, e) for eid, e in enumerate(puzzle.entries if puzzle else ()) if e.direction == self.direction]
+        self.ids = [eid for eid, _ in hits]; self.entries = [e for _, e in hits]
+        self.rows = {eid: row for row, eid in enumerate(self.ids)}
+        self.active = None
+        self.endResetModel()
+
+    def set_active(self, eid):
+        """Highlight the row of puzzle entry eid (None or another direction's entry: no row)."""
+        row = self.rows.get(eid)
+        if row == self.active:
+            return
+        old, self.active = self.active, row
+        for r in (old, row):
+            if r is not None:
+                self.dataChanged.emit(self.index(r, 0), self.index(r, len(self.HEADERS) - 1),
+                                      [QtCore.Qt.ItemDataRole.BackgroundRole, QtCore.Qt.ItemDataRole.ForegroundRole])
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        e = self.entries[index.row()]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return (str(e.number), e.clue or "?", str(len(e.word)))[index.column()]
+        if index.row() == self.active:
+            if role == QtCore.Qt.ItemDataRole.BackgroundRole:
+                return QtGui.QColor("#e6e6ff")
+            if role == QtCore.Qt.ItemDataRole.ForegroundRole:
+                return QtGui.QColor("#000000")
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
 
 class HelpDialog(QtWidgets.QDialog):
     def __init__(self, parent=None):
@@ -364,6 +449,103 @@ class HelpDialog(QtWidgets.QDialog):
         btn.clicked.connect(self.accept)
         layout.addWidget(btn, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
 
+_LAYOUT_CACHE = None
+
+def layout_cache():
+    # opened on first use, so importing v21 (bench_gui.py) does not create the file;
+    # shared by every station that runs from this directory
+    global _LAYOUT_CACHE
+    if _LAYOUT_CACHE is None:
+        _LAYOUT_CACHE = LayoutCache(LAYOUT_CACHE_FILE)
+    return _LAYOUT_CACHE
+
+_SEEN_STORE = None
+
+def seen_store():
+    # opened on first use, like layout_cache()
+    global _SEEN_STORE
+    if _SEEN_STORE is None:
+        _SEEN_STORE = SeenStore(SEEN_STORE_FILE)
+    return _SEEN_STORE
+
+# --- background puzzle prefetch ---
+class PuzzlePrefetcher(QtCore.QThread):
+    """Keeps a bounded queue of ready (pick, grid, placements, compiled puzzle, tag) items filled in the background."""
+    def __init__(self, pool_getter, options_getter=None, size=PREFETCH_SIZE, parent=None, tag_getter=None):
+        super().__init__(parent)
+        # options_getter: extra create_crossword_for_student keywords (index, sampler) for the current pool;
+        # tag_getter: what the draw depended on (the student and their history), stored with each item
+        self.pool_getter = pool_getter; self.options_getter = options_getter; self.tag_getter = tag_getter
+        self.ready = queue.Queue(maxsize=size)
+        self.hits = 0; self.misses = 0; self.dropped = 0
+        self._stopping = False
+
+    def run(self):
+        while not self._stopping:
+            try:
+                item = self.generate_one()
+            except Exception:
+                traceback.print_exc(); self.msleep(500); continue
+            if item is None:
+                continue
+            # block while the queue is full, waking up now and then to notice stop()
+            while not self._stopping:
+                try:
+                    self.ready.put(item, timeout=0.2); break
+                except queue.Full:
+                    pass
+
+    def generate_one(self):
+        # question records are read-only, so the pool is shared with this thread as is
+        tag = self.tag_getter() if self.tag_getter else None
+        options = self.options_getter() if self.options_getter else {}
+        pick, grid, placements = create_crossword_for_student(self.pool_getter(), WORDS_TO_PICK, workers=PARALLEL_WORKERS, cache=layout_cache(), **options)
+        if grid is None or placements is None:
+            return None
+        return pick, grid, placements, compile_puzzle(grid, placements), tag
+
+    def take(self, accept=None):
+        # a ready puzzle, or None when there is none (the caller generates inline). Items accept()
+        # turns down are dropped; a take that ends up generating inline counts as a miss
+        while True:
+            try:
+                item = self.ready.get_nowait()
+            except queue.Empty:
+                self.misses += 1
+                return None
+            if accept is None or accept(item):
+                self.hits += 1
+                return item
+            self.dropped += 1
+
+    def stop(self):
+        self._stopping = True
+        self.wait()
+
+class StartupLoader(QtCore.QThread):
+    """Loads the question bank and builds the index and sampler over it off the GUI thread.
+
+    Building them takes about a second for a large bank; done here, the first dialog stays
+    responsive while it runs. The results are picked up from `finished`."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.question_pool = DUMMY_QUESTIONS
+        self.word_index = None
+        self.sampler = None
+
+    def run(self):
+        try:
+            self.question_pool = load_question_pool(load_config())
+            # answers by length and (position, letter): lets the generator swap in words that cross
+            self.word_index = PatternIndex(self.question_pool)
+            # questions students miss come up more often
+            self.sampler = AdaptiveSampler(self.question_pool)
+            startup.mark("question bank loaded")
+            # opens the leaderboard store (and imports leaderboard.csv the first time)
+            leaderboard()
+        except Exception:
+            traceback.print_exc()
+
 # --- main application ---
 class CrosswordApp(QtWidgets.QMainWindow):
     def __init__(self):
@@ -378,11 +560,19 @@ class CrosswordApp(QtWidgets.QMainWindow):
         self.player_name = None
         self.player_class = None
         self.player_section = None
-        self.question_pool = DUMMY_QUESTIONS.copy()
+        # pool, index, sampler and prefetcher come from finish_startup()'s StartupLoader once the first dialog shows
+        self.question_pool = DUMMY_QUESTIONS
+        self.word_index = None
+        self.sampler = None
+        self.prefetcher = None
+        self.startup_loader = None
+        self._startup_done = False
+        self.seen = None  # question keys the current student has already had (SeenSet), loaded at start
         self.current_questions = []
         self.grid = None
         self.placements = []
-        self.cell_widgets = [[None]*GRID_SIZE for _ in range(GRID_SIZE)]
+        self.puzzle = None  # CompiledPuzzle of the puzzle on screen
+        self.board = BoardModel(GRID_SIZE)
         self.per_word_scores = {}
         self.user_locked_words = set()
         self.total_score = 0
@@ -393,11 +583,43 @@ class CrosswordApp(QtWidgets.QMainWindow):
         self.is_dark_mode = False
         self._last_saved_entryid = None
 
-        self.word_cells = []
-        self.current_direction = None
-        self.active_cell = None
-
         self.init_ui()
+        startup.mark("main window built")
+
+    def finish_startup(self):
+        # the slower half of startup, on a worker while the student is typing into the first dialog
+        if self.startup_loader is not None:
+            return
+        self.startup_loader = StartupLoader(self)
+        self.startup_loader.finished.connect(self.on_startup_loaded)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.startup_loader.wait)
+        self.startup_loader.start()
+
+    def wait_for_startup(self):
+        # generating needs the bank: a student faster than the loader waits for it here
+        self.finish_startup()
+        if not self._startup_done:
+            self.startup_loader.wait()
+            self.on_startup_loaded()
+
+    def on_startup_loaded(self):
+        if self._startup_done:
+            return
+        self._startup_done = True
+        loader = self.startup_loader
+        self.question_pool = loader.question_pool; self.word_index = loader.word_index; self.sampler = loader.sampler
+
+        # start generating puzzles now so the first student doesn't wait for one
+        app = QtWidgets.QApplication.instance()
+        self.prefetcher = PuzzlePrefetcher(lambda: self.question_pool, self.generation_options, PREFETCH_SIZE, self, self.seen_tag)
+        app.aboutToQuit.connect(self.prefetcher.stop)
+        self.prefetcher.start()
+
+        try:
+            self.refresh_leaderboard_table()
+        except Exception:
+            traceback.print_exc()
+        startup.mark("leaderboard loaded")
 
     def init_ui(self):
         central = QtWidgets.QWidget()
@@ -406,21 +628,12 @@ class CrosswordApp(QtWidgets.QMainWindow):
         main_layout.setContentsMargins(6, 6, 6, 6)
         main_layout.setSpacing(8)
 
-        # left grid
-        grid_frame = QtWidgets.QFrame()
-        grid_layout = QtWidgets.QGridLayout(grid_frame)
-        grid_layout.setSpacing(3)
-        grid_layout.setContentsMargins(8, 8, 8, 8)
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                cw = CellWidget(r, c)
-                cw.setDisabled(True)
-                # The eventFilter is correctly installed here, but the method itself was missing.
-                cw.installEventFilter(self)
-                cw.clicked.connect(lambda rr, cc, cw=cw: self.on_cell_clicked(rr, cc, cw))
-                grid_layout.addWidget(cw, r, c)
-                self.cell_widgets[r][c] = cw
-        main_layout.addWidget(grid_frame, 3)
+        # left grid: one painted widget, whatever GRID_SIZE is
+        self.grid_view = CrosswordGrid(self.board)
+        self.grid_view.setDisabled(True)
+        self.grid_view.cellSelected.connect(self.on_cell_selected)
+        self.grid_view.letterEntered.connect(self.on_letter_entered)
+        main_layout.addWidget(self.grid_view, 3)
 
         # right panel
         right = QtWidgets.QFrame()
@@ -451,24 +664,24 @@ class CrosswordApp(QtWidgets.QMainWindow):
         self.tab_clues.addTab(self.tab_down, "Down")
 
         # across table
-        self.across_table = QtWidgets.QTableWidget()
-        self.across_table.setColumnCount(3)
-        self.across_table.setHorizontalHeaderLabels(["Clue No.", "Clue", "Letters"])
-        self.across_table.setEditTriggers(QtWidgets.QTableWidget.EditTrigger.NoEditTriggers)
-        self.across_table.setSelectionBehavior(QtWidgets.QTableWidget.SelectionBehavior.SelectRows)
-        self.across_table.setSelectionMode(QtWidgets.QTableWidget.SelectionMode.SingleSelection)
+        self.across_model = ClueTableModel("across", self)
+        self.across_table = QtWidgets.QTableView()
+        self.across_table.setModel(self.across_model)
+        self.across_table.setEditTriggers(QtWidgets.QTableView.EditTrigger.NoEditTriggers)
+        self.across_table.setSelectionBehavior(QtWidgets.QTableView.SelectionBehavior.SelectRows)
+        self.across_table.setSelectionMode(QtWidgets.QTableView.SelectionMode.SingleSelection)
         self.across_table.verticalHeader().setVisible(False)
         self.across_table.setFont(QtGui.QFont("Segoe UI", 10))
         ac_layout = QtWidgets.QVBoxLayout(self.tab_across)
         ac_layout.addWidget(self.across_table)
 
         # down table
-        self.down_table = QtWidgets.QTableWidget()
-        self.down_table.setColumnCount(3)
-        self.down_table.setHorizontalHeaderLabels(["Clue No.", "Clue", "Letters"])
-        self.down_table.setEditTriggers(QtWidgets.QTableWidget.EditTrigger.NoEditTriggers)
-        self.down_table.setSelectionBehavior(QtWidgets.QTableWidget.SelectionBehavior.SelectRows)
-        self.down_table.setSelectionMode(QtWidgets.QTableWidget.SelectionMode.SingleSelection)
+        self.down_model = ClueTableModel("down", self)
+        self.down_table = QtWidgets.QTableView()
+        self.down_table.setModel(self.down_model)
+        self.down_table.setEditTriggers(QtWidgets.QTableView.EditTrigger.NoEditTriggers)
+        self.down_table.setSelectionBehavior(QtWidgets.QTableView.SelectionBehavior.SelectRows)
+        self.down_table.setSelectionMode(QtWidgets.QTableView.SelectionMode.SingleSelection)
         self.down_table.verticalHeader().setVisible(False)
         self.down_table.setFont(QtGui.QFont("Segoe UI", 10))
         dn_layout = QtWidgets.QVBoxLayout(self.tab_down)
@@ -489,8 +702,8 @@ class CrosswordApp(QtWidgets.QMainWindow):
         dn_header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
 
         # connect clicks to jump
-        self.across_table.cellClicked.connect(lambda r, c: self.on_clue_table_clicked(self.across_table, r))
-        self.down_table.cellClicked.connect(lambda r, c: self.on_clue_table_clicked(self.down_table, r))
+        self.across_table.clicked.connect(lambda index: self.on_clue_table_clicked(self.across_model, index.row()))
+        self.down_table.clicked.connect(lambda index: self.on_clue_table_clicked(self.down_model, index.row()))
 
         # jump controls
         jump_h = QtWidgets.QHBoxLayout()
@@ -564,8 +777,7 @@ class CrosswordApp(QtWidgets.QMainWindow):
         self.btn_toggle_theme.clicked.connect(self.toggle_theme)
         self.btn_about.clicked.connect(self.show_about_dialog)
 
-        # initial refresh
-        self.refresh_leaderboard_table()
+        # the initial leaderboard refresh waits for on_startup_loaded
 
     # -----------------------
     # Player info & motivational
@@ -609,12 +821,20 @@ class CrosswordApp(QtWidgets.QMainWindow):
                 QtWidgets.QMessageBox.warning(dlg, "Missing", "Enter your name")
                 return
             self.player_name = nm; self.player_class = cl; self.player_section = se
+            self.seen = seen_store().get(nm, cl, se)
             self.label_player.setText(nm); self.label_class.setText(cl); self.label_section.setText(se)
             dlg.accept()
             self.show_motivational_screen_and_start()
 
         btn.clicked.connect(do_start)
+        if self.startup_loader is None:
+            QtCore.QTimer.singleShot(0, self.on_first_dialog_shown)
         dlg.exec()
+        dlg.deleteLater()  # shown once per student; don't keep every one parented to the window
+
+    def on_first_dialog_shown(self):
+        startup.report("first dialog shown")
+        self.finish_startup()
 
     def show_motivational_screen_and_start(self):
         md = QtWidgets.QDialog(self)
@@ -638,150 +858,73 @@ class CrosswordApp(QtWidgets.QMainWindow):
         md_layout.addStretch()
 
         md.showFullScreen()
-        QtCore.QTimer.singleShot(4000, lambda: (md.accept(), md.close(), self.generate_and_build()))
+        QtCore.QTimer.singleShot(4000, lambda: (md.accept(), md.close(), md.deleteLater(), self.generate_and_build()))
 
     # -----------------------
     # Generate / build grid
     # -----------------------
     def generate_and_build(self):
         try:
-            pool = self.question_pool.copy()
-            if len(pool) < WORDS_TO_PICK:
-                pool = DUMMY_QUESTIONS.copy()
-            self.current_questions = random.sample(pool, k=WORDS_TO_PICK)
-            pick, grid, placements = create_crossword_for_student(self.current_questions, WORDS_TO_PICK)
-            if grid is None:
-                for _ in range(5):
-                    pick, grid, placements = create_crossword_for_student(self.current_questions, WORDS_TO_PICK)
-                    if grid is not None:
-                        break
-            if grid is None or placements is None:
-                QtWidgets.QMessageBox.critical(self, "Error", "Failed to generate crossword. Try again.")
-                return
-            self.current_questions = pick; self.grid = grid; self.placements = placements
-            self.build_grid_ui_from_solution()
-            self.start_time = None; self.total_score = 0; self.label_score.setText(str(self.total_score))
-            self.compute_clues_and_numbers()
+            self.wait_for_startup()
+            ready = self.prefetcher.take(self.prefetched_puzzle_ok)
+            if ready is not None:
+                pick, grid, placements, puzzle, _ = ready
+            else:
+                # queue empty (first launch or very fast students): generate inline as before
+                pick, grid, placements = create_crossword_for_student(self.question_pool, WORDS_TO_PICK, workers=PARALLEL_WORKERS, cache=layout_cache(), **self.generation_options())
+                if grid is None:
+                    for _ in range(5):
+                        pick, grid, placements = create_crossword_for_student(self.question_pool, WORDS_TO_PICK, workers=PARALLEL_WORKERS, cache=layout_cache(), **self.generation_options())
+                        if grid is not None:
+                            break
+                if grid is None or placements is None:
+                    QtWidgets.QMessageBox.critical(self, "Error", "Failed to generate crossword. Try again.")
+                    return
+                puzzle = compile_puzzle(grid, placements)
+            self.start_puzzle(pick, grid, placements, puzzle)
+            self.mark_questions_seen(pick)
         except Exception:
             traceback.print_exc()
 
+    def start_puzzle(self, pick, grid, placements, puzzle):
+        # a new puzzle only resets state; the grid and tables stay wired from init_ui
+        self.current_questions = pick; self.grid = grid; self.placements = placements; self.puzzle = puzzle
+        self.per_word_scores = {}; self.user_locked_words = set()
+        self.start_time = None; self.end_time = None; self.time_seconds = 0
+        self.build_grid_ui_from_solution()
+        self.total_score = 0; self.label_score.setText(str(self.total_score))
+
     def build_grid_ui_from_solution(self):
-        n = GRID_SIZE
-        for r in range(n):
-            for c in range(n):
-                cw = self.cell_widgets[r][c]
-                ch = self.grid[r][c] if self.grid else " "
-                cw.setReadOnly(False); cw.setDisabled(False)
-                cw.clear(); cw.set_answer(None); cw.locked = False; cw.is_block = False; cw.clear_visuals()
-
-                # FIX: Connect textChanged signal for auto-advance (Horizontal movement fix)
-                # The lambda ensures the current 'cw' is captured correctly
-                cw.textChanged.connect(lambda txt, cw=cw: self.on_text_changed(cw))
-
-                def make_focus(r_, c_, cw_):
-                    def on_focus(ev):
-                        try:
-                            self.on_cell_focus(r_, c_, cw_, ev)
-                        except Exception:
-                            traceback.print_exc()
-                        return QtWidgets.QLineEdit.focusInEvent(cw_, ev)
-                    return on_focus
-                cw.focusInEvent = make_focus(r, c, cw)
-
-                if ch == " ":
-                    cw.set_block()
-                else:
-                    cw.setEnabled(True); cw.set_answer(ch); cw.setText("")
-                cw.clear_visuals()
+        self.board.load(self.puzzle)
+        self.grid_view.reset()
+        self.grid_view.setEnabled(True)
         self.compute_clues_and_numbers()
 
     # -----------------------
     # clue numbering & tables
     # -----------------------
     def compute_clues_and_numbers(self):
-        n = GRID_SIZE; next_num = 1
-        across_clues = []; down_clues = []; placed_map = {}
-        for pl in self.placements:
-            placed_map[pl.word] = (pl.clue, pl)
-        for r in range(n):
-            for c in range(n):
-                if self.grid[r][c] == " ": continue
-                start_across = (c == 0 or self.grid[r][c-1] == " ")
-                start_down = (r == 0 or self.grid[r-1][c] == " ")
-                if start_across or start_down:
-                    num = next_num; next_num += 1
-                else:
-                    num = 0
-                if start_across:
-                    cc = c; word = ""
-                    while cc < n and self.grid[r][cc] != " ":
-                        word += self.grid[r][cc]; cc += 1
-                    clue = placed_map.get(word, ("?", None))[0]
-                    across_clues.append((num, word, clue, r, c))
-                if start_down:
-                    rr = r; word = ""
-                    while rr < n and self.grid[rr][c] != " ":
-                        word += self.grid[rr][c]; rr += 1
-                    clue = placed_map.get(word, ("?", None))[0]
-                    down_clues.append((num, word, clue, r, c))
-        self.across_clues = across_clues; self.down_clues = down_clues
+        # numbering and clue matching were done once by compile_puzzle; this only shows the result
         self.refresh_clue_tables()
 
     def refresh_clue_tables(self):
-        # across
-        self.across_table.setRowCount(0)
-        for num, word, clue, r, c in sorted(self.across_clues, key=lambda x: x[0]):
-            row = self.across_table.rowCount(); self.across_table.insertRow(row)
-            item0 = QtWidgets.QTableWidgetItem(str(num))
-            item1 = QtWidgets.QTableWidgetItem(str(clue))
-            item2 = QtWidgets.QTableWidgetItem(str(len(word)))
-            item0.setData(QtCore.Qt.ItemDataRole.UserRole, ("across", num, word, r, c))
-            self.across_table.setItem(row, 0, item0); self.across_table.setItem(row, 1, item1); self.across_table.setItem(row, 2, item2)
-        # down
-        self.down_table.setRowCount(0)
-        for num, word, clue, r, c in sorted(self.down_clues, key=lambda x: x[0]):
-            row = self.down_table.rowCount(); self.down_table.insertRow(row)
-            item0 = QtWidgets.QTableWidgetItem(str(num))
-            item1 = QtWidgets.QTableWidgetItem(str(clue))
-            item2 = QtWidgets.QTableWidgetItem(str(len(word)))
-            item0.setData(QtCore.Qt.ItemDataRole.UserRole, ("down", num, word, r, c))
-            self.down_table.setItem(row, 0, item0); self.down_table.setItem(row, 1, item1); self.down_table.setItem(row, 2, item2)
-
-    def on_clue_table_clicked(self, table, row_index):
-        item = table.item(row_index, 0)
-        if not item: return
-        data = item.data(QtCore.Qt.ItemDataRole.UserRole)
-        if not data: return
-        direction, num, word, r, c = data
-        self.jump_to(num, direction)
+        self.across_model.set_puzzle(self.puzzle); self.down_model.set_puzzle(self.puzzle)
+
+    def on_clue_table_clicked(self, model, row_index):
+        if not 0 <= row_index < len(model.entries): return
+        e = model.entries[row_index]
+        self.jump_to(e.number, e.direction)
 
     # -----------------------
     # jump & focus helpers
     # -----------------------
-    # ... (jump_to, on_jump, on_cell_clicked, find_word_start, on_cell_focus) ...
     def jump_to(self, clue_num, direction):
-        if direction.lower() == "across":
-            clues = self.across_clues
-            dr, dc = 0, 1
-        elif direction.lower() == "down":
-            clues = self.down_clues
-            dr, dc = 1, 0
-        else: return
-        target = None
-        for num, word, clue, r, c in clues:
-            if num == int(clue_num):
-                target = (r, c, dr, dc)
-                break
-        if target is None: return
-        r, c, dr, dc = target
-        cw = self.cell_widgets[r][c]
-        if cw: cw.setFocus()
-        self.current_direction = (dr, dc)
-        seq = []
-        rr, cc = r, c
-        while 0 <= rr < GRID_SIZE and 0 <= cc < GRID_SIZE and self.grid[rr][cc] != " ":
-            seq.append((rr, cc, self.cell_widgets[rr][cc])); rr += dr; cc += dc
-        self.word_cells = seq
+        direction = direction.lower()
+        wid = self.board.clue_words.get((int(clue_num), direction))
+        if wid is None: return
+        r, c = self.board.words[wid][0]
+        self.grid_view.setFocus()
+        self.grid_view.select(r, c, (0, 1) if direction == "across" else (1, 0))
 
     def on_jump(self):
         num_str = self.jump_num.text().strip()
@@ -791,149 +934,65 @@ class CrosswordApp(QtWidgets.QMainWindow):
         else:
             QtWidgets.QMessageBox.warning(self, "Invalid", "Please enter a valid clue number.")
 
-    def on_cell_clicked(self, r, c, cw):
-        # When a cell is clicked, we call on_cell_focus to determine the word/direction.
-        # This will set the focus if it wasn't already set, and set self.current_direction
-        self.active_cell = (r, c)
-        self.on_cell_focus(r, c, cw, None)
-
-    def find_word_start(self, r, c, dr, dc):
-        # Finds the start (top/left) cell of the word passing through (r, c) in direction (dr, dc)
-        start_r, start_c = r, c
-        while True:
-            prev_r, prev_c = start_r - dr, start_c - dc
-            if 0 <= prev_r < GRID_SIZE and 0 <= prev_c < GRID_SIZE and self.grid[prev_r][prev_c] != " ":
-                start_r, start_c = prev_r, prev_c
-            else:
-                break
-        return start_r, start_c
-
     # -----------------------
-    # focus & typing handling (auto-advance)
+    # grid events
     # -----------------------
-    def on_cell_focus(self, r, c, cw, event):
-        try:
-            self.active_cell = (r, c)
-            ac_start_r, ac_start_c = self.find_word_start(r, c, 0, 1)
-            ac_cells = []; cc = ac_start_c
-            while cc < GRID_SIZE and self.grid[ac_start_r][cc] != " ":
-                ac_cells.append((ac_start_r, cc, self.cell_widgets[ac_start_r][cc])); cc += 1
-
-            dn_start_r, dn_start_c = self.find_word_start(r, c, 1, 0)
-            dn_cells = []; rr = dn_start_r
-            while rr < GRID_SIZE and self.grid[rr][dn_start_c] != " ":
-                dn_cells.append((rr, dn_start_c, self.cell_widgets[rr][dn_start_c])); rr += 1
-
-            cd = getattr(self, "current_direction", None)
-
-            # Logic to switch/choose direction when a cell is focused
-            if cd == (0, 1) and len(ac_cells) > 1: # Prefer Across if it was already selected and valid
-                self.word_cells = ac_cells; self.current_direction = (0, 1)
-            elif cd == (1, 0) and len(dn_cells) > 1: # Prefer Down if it was already selected and valid
-                self.word_cells = dn_cells; self.current_direction = (1, 0)
-            elif len(ac_cells) >= len(dn_cells) and len(ac_cells) > 1: # Choose the longest valid direction
-                self.word_cells = ac_cells; self.current_direction = (0, 1)
-            elif len(dn_cells) > 1:
-                self.word_cells = dn_cells; self.current_direction = (1, 0)
-            else:
-                 # Fallback, just pick one
-                self.word_cells = ac_cells if ac_cells else dn_cells
-                self.current_direction = (0, 1) if ac_cells else (1, 0)
-
-            # Style the current active word cells
-            for cr, cc, cell in self.cell_widgets_flat():
-                cell.clear_visuals()
-            for wr, wc, wcell in self.word_cells:
-                wcell.setStyleSheet("background-color: #e6e6ff; color: black; border: 2px solid #0056b3;")
-
-            # Style the focused cell differently
-            cw.setStyleSheet("background-color: #ccccff; color: black; border: 2px solid #0056b3; font-weight: bold;")
-           
-            # Update the clue tab to reflect the chosen direction
-            self.tab_clues.setCurrentIndex(0 if self.current_direction == (0, 1) else 1)
-
-        except Exception:
-            traceback.print_exc()
-
-    def on_text_changed(self, obj):
-        try:
-            txt = obj.text().upper()
-            if txt: obj.blockSignals(True); obj.setText(txt[0]); obj.blockSignals(False)
-            if self.start_time is None: self.start_time = time.time()
-           
-            # This block of code determines the next cell for auto-advance
-            dr, dc = self.current_direction if self.current_direction is not None else (0, 1)
-           
-            # Find the current cell's index within the active word sequence
-            current_index = -1
-            for i, (r, c, cell) in enumerate(self.word_cells):
-                if r == obj.r and c == obj.c:
-                    current_index = i
-                    break
-           
-            # Move to the next cell in the sequence if one exists
-            next_index = current_index + 1
-            if 0 <= next_index < len(self.word_cells):
-                nr, nc, next_cell = self.word_cells[next_index]
-                if not next_cell.is_block and not next_cell.locked:
-                    next_cell.setFocus()
-           
-        except Exception:
-            traceback.print_exc()
-
-    def can_move(self, r, c, dr, dc):
-        nr, nc = r + dr, c + dc
-        if 0 <= nr < GRID_SIZE and 0 <= nc < GRID_SIZE:
-            nw = self.cell_widgets[nr][nc]; return (not nw.is_block) and (not nw.locked)
-        return False
-
-    def move_focus(self, r, c):
-        if 0 <= r < GRID_SIZE and 0 <= c < GRID_SIZE:
-            cw = self.cell_widgets[r][c]
-            if cw and not cw.is_block and not cw.locked:
-                cw.setFocus()
-
-    # FIX: Add eventFilter to handle arrow keys and backspace (Horizontal movement fix)
-    def eventFilter(self, obj, event):
-        if event.type() == QtCore.QEvent.Type.KeyPress and isinstance(obj, CellWidget):
-            key = event.key()
-            r, c = obj.r, obj.c
-           
-            # Handle direction switching by re-clicking the cell (Space or Enter key is usually better, but arrow keys can also trigger an internal direction switch based on context if not moving)
-            if key in (QtCore.Qt.Key.Key_Up, QtCore.Qt.Key.Key_Down, QtCore.Qt.Key.Key_Left, QtCore.Qt.Key.Key_Right) and (r, c) == self.active_cell:
-                # If the key press is one of the directional arrows, check if we should switch direction.
-                # A simple way to toggle direction is to re-run the on_cell_focus logic with the opposite initial preference.
-                # However, the current on_cell_focus logic doesn't support a simple toggle flag.
-                # We'll stick to simple movement and let on_cell_focus re-establish the active word on focus change.
-                pass
-               
-            # 1. Handle standard movement (manually move focus)
-            if key == QtCore.Qt.Key.Key_Right:
-                self.move_focus(r, c + 1)
-                return True # Event handled
-            elif key == QtCore.Qt.Key.Key_Left:
-                self.move_focus(r, c - 1)
-                return True # Event handled
-            elif key == QtCore.Qt.Key.Key_Down:
-                self.move_focus(r + 1, c)
-                return True # Event handled
-            elif key == QtCore.Qt.Key.Key_Up:
-                self.move_focus(r - 1, c)
-                return True # Event handled
-
-            # 2. Handle Backspace (move focus backwards in the current word, if the cell is empty)
-            elif key == QtCore.Qt.Key.Key_Backspace and not obj.text():
-                if self.current_direction is not None:
-                    dr, dc = self.current_direction
-                    # Move backwards: r - dr, c - dc
-                    prev_r, prev_c = r - dr, c - dc
-                    if 0 <= prev_r < GRID_SIZE and 0 <= prev_c < GRID_SIZE:
-                        prev_cell = self.cell_widgets[prev_r][prev_c]
-                        if not prev_cell.is_block and not prev_cell.locked:
-                            prev_cell.setFocus()
-                            return True # Event handled
-
-        return super().eventFilter(obj, event)
+    def on_cell_selected(self, r, c):
+        # show the clue list for the direction the grid picked, with the active word's row highlighted
+        across = self.grid_view.direction == (0, 1)
+        self.tab_clues.setCurrentIndex(0 if across else 1)
+        hit = self.board.word_at.get(self.grid_view.direction, {}).get((r, c))
+        eid = hit[0] if hit else None
+        self.across_model.set_active(eid); self.down_model.set_active(eid)
+        model, table = (self.across_model, self.across_table) if across else (self.down_model, self.down_table)
+        if model.active is not None:
+            table.scrollTo(model.index(model.active, 0))
+
+    def on_letter_entered(self, r, c):
+        if self.start_time is None: self.start_time = time.time()
+
+    def generation_options(self):
+        return {"index": self.word_index, "sampler": self.sampler, "exclude": self.seen}
+
+    def seen_tag(self):
+        # the student a puzzle is drawn for and how much of their history the draw excluded
+        if self.seen is None or not self.player_name:
+            return None
+        return student_key(self.player_name, self.player_class, self.player_section), len(self.seen)
+
+    def prefetched_puzzle_ok(self, item):
+        # drawn against exactly the current history: the sampler only repeated what it had to
+        if item[4] is not None and item[4] == self.seen_tag():
+            return True
+        return self.avoidable_repeats(item[0]) == 0
+
+    def avoidable_repeats(self, pick):
+        # questions in pick the student has seen, beyond those a fresh draw would have to repeat
+        # because fewer than WORDS_TO_PICK unseen questions are left
+        if not self.seen:
+            return 0
+        repeats = sum(1 for q in pick if question_key(q) in self.seen)
+        if not repeats:
+            return 0
+        pool = self.question_pool
+        unseen = len(pool) - len(self.seen)
+        if unseen < WORDS_TO_PICK:
+            # the history may hold questions this bank lacks: count exactly (only near the end of the bank)
+            unseen = sum(1 for q in pool if question_key(q) not in self.seen)
+        return max(0, repeats - max(0, WORDS_TO_PICK - unseen))
+
+    def mark_questions_seen(self, pick):
+        if self.seen is None or not self.player_name:
+            return
+        keys = [question_key(q) for q in pick]
+        self.seen.update(keys)
+        seen_store().mark(self.player_name, self.player_class, self.player_section, keys)
+
+    def record_word_result(self, word, wrong_count):
+        # feed the result back into the sampler's weight for that question
+        for q in self.current_questions:
+            if q["answer"] == word:
+                self.sampler.record(q, wrong_count, len(word)); break
 
     # FIX: Missing method added (Likely cause of runtime error)
     def recompute_total_score(self):
@@ -948,36 +1007,12 @@ class CrosswordApp(QtWidgets.QMainWindow):
     # word check & scoring
     # -----------------------
     def get_current_word_cells(self):
-        focus = QtWidgets.QApplication.focusWidget(); focus_is_cell = isinstance(focus, CellWidget)
-        if not focus_is_cell:
-            if self.active_cell is None:
-                QtWidgets.QMessageBox.information(self, "No cell selected", "Please select a cell in the word you want to check.")
-                return None, None, None
-            else:
-                r, c = self.active_cell; focus = self.cell_widgets[r][c]
-                if not isinstance(focus, CellWidget):
-                    QtWidgets.QMessageBox.information(self, "No cell selected", "Please select a cell in the word you want to check.")
-                    return None, None, None
-
-        r, c = focus.r, focus.c
-        cd = self.current_direction
-        if cd is None: # fallback, re-run focus logic if needed
-            self.on_cell_focus(r, c, focus, None)
-            cd = self.current_direction
-
-        if cd is None: # Still none, cannot proceed
-            QtWidgets.QMessageBox.warning(self, "Invalid Word", "Cannot determine word direction.")
+        if self.grid_view.active is None or not self.grid_view.word:
+            QtWidgets.QMessageBox.information(self, "No cell selected", "Please select a cell in the word you want to check.")
             return None, None, None
-
-        dr, dc = cd
-        start_r, start_c = self.find_word_start(r, c, dr, dc)
-
-        cells = []
-        rr, cc = start_r, start_c
-        while 0 <= rr < GRID_SIZE and 0 <= cc < GRID_SIZE and self.grid[rr][cc] != " ":
-            cells.append((rr, cc)); rr += dr; cc += dc
+        cells = list(self.grid_view.word)
         word = "".join(self.grid[r][c] for r, c in cells)
-        return cells, word, cd
+        return cells, word, self.grid_view.direction
 
     def check_current_word_action(self):
         cells, solution_word, direction = self.get_current_word_cells()
@@ -987,28 +1022,15 @@ class CrosswordApp(QtWidgets.QMainWindow):
         if key in self.user_locked_words:
             QtWidgets.QMessageBox.information(self, "Locked", "This word has already been checked and locked."); return
            
-        wrong_positions = []
-        for idx, (r, c) in enumerate(cells):
-            user_ch = self.cell_widgets[r][c].text().strip().upper()
-            sol_ch = self.grid[r][c]
-            if user_ch != sol_ch:
-                wrong_positions.append(idx)
-       
-        wrong_count = len(wrong_positions); score = SCORE_BY_WRONG.get(wrong_count, 1)
-
-        if wrong_count == 0:
-            for r, c in cells:
-                self.cell_widgets[r][c].setText(self.grid[r][c]); self.cell_widgets[r][c].mark_correct(); self.cell_widgets[r][c].set_locked()
-        else:
-            for idx, (r, c) in enumerate(cells):
-                if idx in wrong_positions:
-                    self.cell_widgets[r][c].mark_incorrect()
-                else:
-                    self.cell_widgets[r][c].mark_correct()
-                self.cell_widgets[r][c].set_locked()
+        state = self.board.state
+        [(wrong, wrong_count, score)] = state.grade([state.offsets_of(cells)])
+        for (r, c), bad in zip(cells, wrong):
+            self.board.mark(r, c, "incorrect" if bad else "correct")
+        self.grid_view.update_cells(cells)
                
         if key not in self.per_word_scores:
             self.per_word_scores[key] = score; self.user_locked_words.add(key)
+            self.record_word_result(solution_word, wrong_count)
            
         self.recompute_total_score()
         QtWidgets.QMessageBox.information(self, "Checked", f"Word checked. Wrong letters: {wrong_count}. Score: {score}")
@@ -1028,37 +1050,18 @@ class CrosswordApp(QtWidgets.QMainWindow):
 
 
     def evaluate_all_words(self):
-        for pl in self.placements:
-            cells = []
-            for i in range(len(pl.word)):
-                rr = pl.r + pl.dr * i; cc = pl.c + pl.dc * i; cells.append((rr, cc))
-           
+        # every placed word graded in one pass; only the unlocked ones are marked and scored
+        for pl, (wrong, wrong_count, score) in zip(self.puzzle.placed(), self.board.state.grade()):
             key = (pl.word, pl.r, pl.c)
             if key in self.user_locked_words: continue
-           
-            wrong_positions = []
-            for idx, (r, c) in enumerate(cells):
-                user_ch = self.cell_widgets[r][c].text().strip().upper()
-                sol_ch = pl.word[idx]
-                if user_ch != sol_ch:
-                    wrong_positions.append(idx)
-                   
-            wrong_count = len(wrong_positions); score = SCORE_BY_WRONG.get(wrong_count, 1)
-
-            if wrong_count == 0:
-                for r, c in cells:
-                    self.cell_widgets[r][c].setText(self.grid[r][c]); self.cell_widgets[r][c].mark_correct(); self.cell_widgets[r][c].set_locked()
-            else:
-                for idx, (r, c) in enumerate(cells):
-                    if idx in wrong_positions:
-                        self.cell_widgets[r][c].mark_incorrect()
-                    else:
-                        self.cell_widgets[r][c].mark_correct()
-                    self.cell_widgets[r][c].set_locked()
+            for i, bad in enumerate(wrong):
+                self.board.mark(pl.r + pl.dr * i, pl.c + pl.dc * i, "incorrect" if bad else "correct")
                    
             if key not in self.per_word_scores:
                 self.per_word_scores[key] = score; self.user_locked_words.add(key)
+                self.record_word_result(pl.word, wrong_count)
                
+        self.grid_view.update()
         self.recompute_total_score()
 
     def finish_action(self):
@@ -1078,12 +1081,7 @@ class CrosswordApp(QtWidgets.QMainWindow):
                 name = self.player_name if self.player_name else "Anonymous"
                 clas = self.player_class if self.player_class else ""
                 section = self.player_section if self.player_section else ""
-                df, entryid = append_leaderboard_entry(name, clas, section, self.total_score, self.time_seconds)
-                self._last_saved_entryid = entryid
-               
-                # refresh leaderboard from df safely
-                try: self.refresh_leaderboard_table_from_df(df)
-                except Exception: traceback.print_exc()
+                self._last_saved_entryid = append_leaderboard_entry(name, clas, section, self.total_score, self.time_seconds)
                 self.refresh_leaderboard_table()
                
             except Exception:
@@ -1095,11 +1093,7 @@ class CrosswordApp(QtWidgets.QMainWindow):
                 QtWidgets.QMessageBox.information(self, "Finished", f"Great job, {self.player_name or 'Player'}! You scored {self.total_score} points!")
             except Exception: pass
            
-            try:
-                for r in range(GRID_SIZE):
-                    for c in range(GRID_SIZE):
-                        cw = self.cell_widgets[r][c]
-                        if cw: cw.setDisabled(True)
+            try: self.grid_view.setDisabled(True)
             except Exception: traceback.print_exc()
            
             # show feedback in timer to avoid nested modal issues
@@ -1147,6 +1141,7 @@ class CrosswordApp(QtWidgets.QMainWindow):
         self.btn_heart_no.clicked.connect(lambda: do_submit(""))
         btn_submit.clicked.connect(lambda: do_submit("")) # Default submit with no heart
         d.exec()
+        d.deleteLater()
 
 
     # ---- Compatibility wrapper (V21 fix) ----
@@ -1156,14 +1151,6 @@ class CrosswordApp(QtWidgets.QMainWindow):
     # -----------------------
     # utility functions
     # -----------------------
-    def cell_widgets_flat(self):
-        # A generator for all non-block cell widgets
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                cw = self.cell_widgets[r][c]
-                if cw and not cw.is_block:
-                    yield r, c, cw
-
     def show_about_dialog(self):
         QtWidgets.QMessageBox.information(
             self,
@@ -1217,32 +1204,10 @@ class CrosswordApp(QtWidgets.QMainWindow):
         # FIX: Corrected Average Rating Calculation and Display
         def update_stats_labels_safe():
             try:
-                df_all = load_leaderboard()
-                if df_all is None or df_all.empty:
-                    self.stats_hearts_label.setText("❤️ Total Hearts: 0")
-                    self.stats_avg_label.setText("⭐ Average Rating: N/A")
-                    return
-                # hearts: count exact "❤️"
-                hearts = 0
-                if "Heart" in df_all.columns:
-                    try:
-                        hearts = df_all["Heart"].astype(str).fillna("").apply(lambda x: 1 if x.strip() == "❤️" else 0).sum()
-                    except Exception: hearts = 0
+                # hearts count exact "❤️"; the average only covers valid 1-10 ratings (None if there are none)
+                hearts, avg = leaderboard().stats()
                 self.stats_hearts_label.setText(f"❤️ Total Hearts: {hearts}")
-               
-                ratings = []
-                if "Rating" in df_all.columns:
-                    for v_ in df_all["Rating"].astype(str).fillna(""):
-                        try:
-                            # Only count valid integer ratings (1 to 10)
-                            iv = int(v_)
-                            if 1 <= iv <= 10:
-                                ratings.append(iv)
-                        except: pass
-               
-                if ratings:
-                    # FIX: Calculate average only on valid ratings
-                    avg = round(sum(ratings)/len(ratings), 1)
+                if avg is not None:
                     self.stats_avg_label.setText(f"⭐ Average Rating: {avg} / 10")
                 else:
                     # FIX: Set to N/A if no valid ratings are found
@@ -1255,13 +1220,9 @@ class CrosswordApp(QtWidgets.QMainWindow):
        
         def refresh_table_safe():
             try:
+                rows = leaderboard().top()
                 table.setRowCount(0)
-                df_all = load_leaderboard()
-                if df_all.empty:
-                    table.setRowCount(0); return
-                df_all = df_all.sort_values(by=["Score", "Name"], ascending=[False, True]).reset_index(drop=True)
-                for i, row_data in df_all.iterrows():
-                    row = row_data.to_dict()
+                for i, row in enumerate(rows):
                     row_idx = table.rowCount(); table.insertRow(row_idx)
                    
                     item0 = QtWidgets.QTableWidgetItem(str(i+1))
@@ -1294,21 +1255,12 @@ class CrosswordApp(QtWidgets.QMainWindow):
         h.addWidget(btn_add); h.addWidget(btn_remove); h.addWidget(btn_edit); h.addWidget(btn_export); h.addWidget(btn_change_time); h.addWidget(btn_newp); h.addWidget(btn_erase)
         v.addLayout(h)
 
-        # helper to find indexes by entryid or by name
-        def find_indexes_by_entry_or_name(df_all, entryid, name):
-            if df_all is None or df_all.empty: return []
-            if entryid:
-                try:
-                    idxs = df_all.index[df_all["EntryID"].astype(str) == str(entryid)].tolist()
-                    if idxs: return idxs
-                except Exception: pass
-            # fallback to name match (exact)
-            if name:
-                try:
-                    idxs2 = df_all.index[df_all["Name"].astype(str) == str(name)].tolist()
-                    if idxs2: return idxs2
-                except Exception: pass
-            return []
+        # helper to find entries by entryid, falling back to an exact name match
+        def find_entries_by_entry_or_name(entryid, name):
+            try:
+                return leaderboard().find(entryid, name)
+            except Exception:
+                traceback.print_exc(); return []
 
         def add_student():
             try:
@@ -1325,11 +1277,8 @@ class CrosswordApp(QtWidgets.QMainWindow):
                         return
                    
                     try:
-                        df2 = load_leaderboard(); entry_id = str(uuid.uuid4())
-                        new_entry = pd.DataFrame([{"EntryID": entry_id, "Name": nm, "Class": cl, "Section": se, "Score": sc, "TimeSeconds": 0, "Rating": "", "FeedbackWord": "", "Heart": ""}])
-                        df2 = pd.concat([df2, new_entry], ignore_index=True)
-                        df2 = df2.sort_values(by=["Score", "Name"], ascending=[False, True]).reset_index(drop=True)
-                        save_leaderboard_df(df2); refresh_table_safe(); d.accept()
+                        leaderboard().add({"EntryID": str(uuid.uuid4()), "Name": nm, "Class": cl, "Section": se, "Score": sc, "TimeSeconds": 0})
+                        refresh_table_safe(); d.accept()
                     except Exception:
                         traceback.print_exc()
                         QtWidgets.QMessageBox.warning(d, "Error", "Could not save entry.")
@@ -1355,16 +1304,13 @@ class CrosswordApp(QtWidgets.QMainWindow):
                 confirm = QtWidgets.QMessageBox.question(dlg, "Remove Entry", "Are you sure you want to remove the selected entry?", QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No)
                 if confirm != QtWidgets.QMessageBox.StandardButton.Yes: return
                
-                df_all = load_leaderboard()
-                idxs = find_indexes_by_entry_or_name(df_all, entryid, table.item(row,1).text() if table.item(row,1) else "")
+                ids = find_entries_by_entry_or_name(entryid, table.item(row,1).text() if table.item(row,1) else "")
                
-                if not idxs:
+                if not ids:
                     QtWidgets.QMessageBox.warning(dlg, "Not found", "Could not identify the selected entry to remove.")
                     return
                 else:
-                    df_all = df_all.drop(index=idxs)
-                    df_all = df_all.sort_values(by=["Score", "Name"], ascending=[False, True]).reset_index(drop=True)
-                    save_leaderboard_df(df_all)
+                    leaderboard().remove(ids)
                     refresh_table_safe()
             except Exception:
                 traceback.print_exc()
@@ -1393,16 +1339,14 @@ class CrosswordApp(QtWidgets.QMainWindow):
                         QtWidgets.QMessageBox.warning(d, "Invalid", "Enter numeric value")
                         return
                     try:
-                        df_all = load_leaderboard()
-                        idxs = find_indexes_by_entry_or_name(df_all, entryid, table.item(row,1).text() if table.item(row,1) else "")
-                        if not idxs:
+                        ids = find_entries_by_entry_or_name(entryid, table.item(row,1).text() if table.item(row,1) else "")
+                        if not ids:
                             QtWidgets.QMessageBox.warning(d, "Not found", "Entry not found")
                             d.accept()
                             return
-                        for i in idxs:
-                            df_all.at[i, "Score"] = nv
-                        df_all = df_all.sort_values(by=["Score", "Name"], ascending=[False, True]).reset_index(drop=True)
-                        save_leaderboard_df(df_all); refresh_table_safe(); d.accept()
+                        for i in ids:
+                            leaderboard().update(i, Score=nv)
+                        refresh_table_safe(); d.accept()
                     except Exception:
                         traceback.print_exc()
                         QtWidgets.QMessageBox.warning(d, "Error", "Could not save score.")
@@ -1416,7 +1360,7 @@ class CrosswordApp(QtWidgets.QMainWindow):
             try:
                 path, _ = QtWidgets.QFileDialog.getSaveFileName(dlg, "Save CSV", "leaderboard_export.csv", "CSV Files (*.csv)")
                 if not path: return
-                load_leaderboard().to_csv(path, index=False)
+                leaderboard().export_csv(path)
                 QtWidgets.QMessageBox.information(dlg, "Saved", f"Exported to {path}")
             except Exception:
                 traceback.print_exc()
@@ -1445,16 +1389,14 @@ class CrosswordApp(QtWidgets.QMainWindow):
                         QtWidgets.QMessageBox.warning(d, "Invalid", "Enter numeric value")
                         return
                     try:
-                        df_all = load_leaderboard()
-                        idxs = find_indexes_by_entry_or_name(df_all, entryid, table.item(row,1).text() if table.item(row,1) else "")
-                        if not idxs:
+                        ids = find_entries_by_entry_or_name(entryid, table.item(row,1).text() if table.item(row,1) else "")
+                        if not ids:
                             QtWidgets.QMessageBox.warning(d, "Not found", "Entry not found")
                             d.accept()
                             return
-                        for i in idxs:
-                            df_all.at[i, "TimeSeconds"] = nv
-                        df_all = df_all.sort_values(by=["Score", "Name"], ascending=[False, True]).reset_index(drop=True)
-                        save_leaderboard_df(df_all); refresh_table_safe(); d.accept()
+                        for i in ids:
+                            leaderboard().update(i, TimeSeconds=nv)
+                        refresh_table_safe(); d.accept()
                     except Exception:
                         traceback.print_exc()
                         QtWidgets.QMessageBox.warning(d, "Error", "Could not save time.")
@@ -1478,10 +1420,7 @@ class CrosswordApp(QtWidgets.QMainWindow):
                 confirm = QtWidgets.QMessageBox.question(dlg, "Erase Leaderboard", "This will permanently erase all leaderboard data. Are you sure?", QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No)
                 if confirm != QtWidgets.QMessageBox.StandardButton.Yes: return
                
-                # create an empty leaderboard with required columns
-                required = ["EntryID", "Name", "Class", "Section", "Score", "TimeSeconds", "Rating", "FeedbackWord", "Heart"]
-                df_empty = pd.DataFrame(columns=required)
-                save_leaderboard_df(df_empty)
+                leaderboard().clear()
                 refresh_table_safe()
                 QtWidgets.QMessageBox.information(dlg, "Erased", "Leaderboard has been erased.")
             except Exception:
@@ -1497,22 +1436,12 @@ class CrosswordApp(QtWidgets.QMainWindow):
     # leaderboard (player side)
     # -----------------------
     def refresh_leaderboard_table(self):
-        df = load_leaderboard()
-        if df.empty: self.lb_table.setRowCount(0); return
-       
-        df2 = df.sort_values(by=["Score", "Name"], ascending=[False, True]).reset_index(drop=True)
-        # ensure rank column exists safely
-        if "Rank" not in df2.columns:
-            df2.insert(0, "Rank", df2.index + 1)
-        else:
-            df2["Rank"] = df2.index + 1
-        df2 = df2.head(5)
-        self.refresh_leaderboard_table_from_df(df2)
-
-    def refresh_leaderboard_table_from_df(self, df):
-        df2 = df.copy().reset_index(drop=True)
-        self.lb_table.setRowCount(df2.shape[0])
-        for i, row in df2.iterrows():
+        # top five straight from the store, already in rank order
+        self.refresh_leaderboard_table_from_rows(leaderboard().top(5))
+
+    def refresh_leaderboard_table_from_rows(self, rows):
+        self.lb_table.setRowCount(len(rows))
+        for i, row in enumerate(rows):
             self.lb_table.setItem(i, 0, QtWidgets.QTableWidgetItem(str(row.get("Rank", i+1))))
             self.lb_table.setItem(i, 1, QtWidgets.QTableWidgetItem(str(row.get("Name", ""))))
             self.lb_table.setItem(i, 2, QtWidgets.QTableWidgetItem(str(row.get("Class", ""))))
@@ -1557,6 +1486,7 @@ class CrosswordApp(QtWidgets.QMainWindow):
 # --- entrypoint ---
 def main():
     app = QtWidgets.QApplication(sys.argv); app.setStyle("Fusion")
+    startup.mark("QApplication created")
     pal = QtGui.QPalette(); pal.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor("#f5f5f5")); pal.setColor(QtGui.QPalette.ColorRole.WindowText, QtGui.QColor("#222222")); pal.setColor(QtGui.QPalette.ColorRole.Base, QtGui.QColor("#ffffff")); pal.setColor(QtGui.QPalette.ColorRole.AlternateBase, QtGui.QColor("#f0f0f0")); pal.setColor(QtGui.QPalette.ColorRole.Text, QtGui.QColor("#000000")); pal.setColor(QtGui.QPalette.ColorRole.Button, QtGui.QColor("#e0e0e0")); pal.setColor(QtGui.QPalette.ColorRole.ButtonText, QtGui.QColor("#000000")); pal.setColor(QtGui.QPalette.ColorRole.Highlight, QtGui.QColor("#0078d7")); pal.setColor(QtGui.QPalette.ColorRole.HighlightedText, QtGui.QColor("#ffffff"))
     app.setPalette(pal)
     window = CrosswordApp()
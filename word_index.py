@@ -0,0 +1,119 @@
+# word_index.py
+# CROSSWORD PUZZLE — pattern index over a question bank's answers (no Qt, no pandas).
+# Answers are grouped by length; within a group every (position, letter) has a bitset of the
+# group's words, stored as one Python int. "7 letters, E at 2, R at 5" is then two big-int ANDs.
+
+import random
+from array import array
+
+from crossword_gen import fits, normalize_answer
+
+def _bits_to_positions(bits):
+    # indices of the set bits, scanning the binary string in C rather than bit by bit in Python
+    s = bin(bits)[:1:-1]
+    out = []; i = s.find("1")
+    while i != -1:
+        out.append(i); i = s.find("1", i + 1)
+    return out
+
+class _LengthGroup:
+    __slots__ = ("ids", "all", "bits")
+    def __init__(self, ids, answers):
+        L = len(answers[0])
+        self.ids = array("I", ids)
+        self.all = (1 << len(answers)) - 1
+        self.bits = []
+        joined = "".join(answers)
+        for pos in range(L):
+            column = joined[pos::L]  # letter `pos` of every answer in the group
+            by_letter = {}
+            if column.isascii():
+                # one translate per letter turns the column into a '1'/'0' string, read as base 2
+                raw = column.encode("ascii")
+                for ch in set(column):
+                    table = bytes(0x31 if b == ord(ch) else 0x30 for b in range(256))
+                    by_letter[ch] = int(raw.translate(table)[::-1], 2)
+            else:
+                for i, ch in enumerate(column):
+                    by_letter[ch] = by_letter.get(ch, 0) | (1 << i)
+            self.bits.append(by_letter)
+
+class PatternIndex:
+    """Answers of a question list by length and (position, letter); ids are positions in that list."""
+    def __init__(self, questions):
+        self.questions = questions
+        by_len = {}
+        for qid, q in enumerate(questions):
+            answer = normalize_answer(q["answer"])
+            if answer:
+                by_len.setdefault(len(answer), ([], []))
+                by_len[len(answer)][0].append(qid); by_len[len(answer)][1].append(answer)
+        self.groups = {L: _LengthGroup(ids, answers) for L, (ids, answers) in by_len.items()}
+
+    def __len__(self):
+        return sum(len(g.ids) for g in self.groups.values())
+
+    def lengths(self):
+        return sorted(self.groups)
+
+    def query_bits(self, length, fixed=None):
+        """Bitset (over the length group) of answers with fixed[pos] == letter for every given pos."""
+        group = self.groups.get(length)
+        if group is None:
+            return 0
+        bits = group.all
+        for pos, ch in (fixed or {}).items():
+            bits &= group.bits[pos].get(ch, 0)
+            if not bits:
+                break
+        return bits
+
+    def count(self, length, fixed=None):
+        return self.query_bits(length, fixed).bit_count()
+
+    def query(self, length, fixed=None):
+        """Question ids of every matching answer."""
+        bits = self.query_bits(length, fixed)
+        ids = self.groups[length].ids if bits else ()
+        return [ids[i] for i in _bits_to_positions(bits)]
+
+    def match(self, pattern):
+        """Question ids for a pattern such as "??E??R?" ("?" or "." for any letter)."""
+        pattern = normalize_answer(pattern)
+        return self.query(len(pattern), {i: ch for i, ch in enumerate(pattern) if ch not in "?."})
+
+    # --- crossing lookup for the generator ---
+    def fit_word(self, grid, exclude=(), rng=None, cells=12, per_slot=8):
+        """A bank word that crosses a placed letter and fits: (question, r, c, dr, dc), or None.
+
+        exclude holds answers already in the puzzle. Tries up to `cells` random filled cells and,
+        through each, every slot length and offset the index has words for."""
+        rng = rng or random
+        n = len(grid)
+        filled = [(r, c) for r in range(n) for c in range(n) if grid[r][c] != " "]
+        rng.shuffle(filled)
+        lengths = [L for L in self.lengths() if 2 <= L <= n]
+        for r0, c0 in filled[:cells]:
+            for dr, dc in rng.sample([(0, 1), (1, 0)], 2):
+                for L in rng.sample(lengths, len(lengths)):
+                    for idx in range(L):
+                        r = r0 - dr*idx; c = c0 - dc*idx
+                        if not (0 <= r and 0 <= c and r + dr*(L-1) < n and c + dc*(L-1) < n):
+                            continue
+                        fixed = {}
+                        for i in range(L):
+                            ch = grid[r + dr*i][c + dc*i]
+                            if ch != " ":
+                                fixed[i] = ch
+                        if len(fixed) == L:
+                            continue  # nothing left to fill: this is (part of) a placed word
+                        positions = _bits_to_positions(self.query_bits(L, fixed))
+                        if not positions:
+                            continue
+                        ids = self.groups[L].ids
+                        for i in rng.sample(positions, min(per_slot, len(positions))):
+                            q = self.questions[ids[i]]
+                            word = normalize_answer(q["answer"])
+                            if word not in exclude and fits(grid, word, r, c, dr, dc):
+                                return q, r, c, dr, dc
+        return None